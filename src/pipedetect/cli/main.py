@@ -2,8 +2,10 @@
 
 from pathlib import Path
 from typing import Optional
+import os
 import sys
 
+import cv2
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -11,6 +13,7 @@ from rich.text import Text
 
 from ..core.models import DetectionConfig
 from ..core.exceptions import PipeDetectError
+from ..io.file_manager import DEFAULT_JPEG_QUALITY
 from ..utils.logging_config import setup_logging, get_log_level_from_verbosity
 from .processor import PoseProcessor
 
@@ -59,12 +62,29 @@ def main(
         max=1.0,
         help="Minimum tracking confidence"
     ),
-    model_complexity: int = typer.Option(
-        1,
+    model_complexity: Optional[int] = typer.Option(
+        None,
         "--model-complexity",
         min=0,
         max=2,
-        help="Model complexity (0=light, 1=full, 2=heavy)"
+        help="Model complexity (0=light, 1=full, 2=heavy) [default: 1, or 0 with --fast]"
+    ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Use the lite pose model for higher throughput on long videos"
+    ),
+    model_asset: Optional[Path] = typer.Option(
+        None,
+        "--model-asset",
+        exists=True,
+        dir_okay=False,
+        help="PoseLandmarker .task model; runs the MediaPipe Tasks API in video mode"
+    ),
+    gpu: bool = typer.Option(
+        True,
+        "--gpu/--cpu",
+        help="Try the GPU delegate for the --model-asset model, falling back to CPU"
     ),
     enable_segmentation: bool = typer.Option(
         False,
@@ -86,6 +106,39 @@ def main(
         "--no-overlays", 
         help="Don't save overlay frames"
     ),
+    jpeg_quality: int = typer.Option(
+        DEFAULT_JPEG_QUALITY,
+        "--jpeg-quality",
+        min=1,
+        max=100,
+        help="JPEG quality of saved frames and overlays; lower encodes faster"
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Worker processes for image directories"
+    ),
+    skip_frames: int = typer.Option(
+        1,
+        "--skip-frames",
+        min=1,
+        help="Run pose detection every N video frames, tracking landmarks in between"
+    ),
+    static_threshold: float = typer.Option(
+        0.0,
+        "--static-threshold",
+        min=0.0,
+        max=255.0,
+        help="Reuse the last video detection while frames change by less than this "
+             "mean grayscale level (0 = detect every frame)"
+    ),
+    cv_threads: Optional[int] = typer.Option(
+        None,
+        "--cv-threads",
+        min=0,
+        help="OpenCV worker threads (default: half the CPU cores)"
+    ),
     no_progress: bool = typer.Option(
         False,
         "--no-progress",
@@ -119,6 +172,12 @@ def main(
         pipedetect image.jpg --output-dir results/
         pipedetect images/ --json poses.json --csv poses.csv
         pipedetect video.mp4 --model-complexity 2 --detection-confidence 0.7
+        pipedetect images/ --workers 4
+        pipedetect video.mp4 --skip-frames 3
+        pipedetect video.mp4 --static-threshold 1.5
+        pipedetect video.mp4 --fast
+        pipedetect video.mp4 --cv-threads 2
+        pipedetect video.mp4 --model-asset pose_landmarker_full.task
     """
     try:
         # Setup logging
@@ -126,33 +185,49 @@ def main(
         setup_logging(
             log_level=log_level,
             log_file=log_file,
-            enable_console=not quiet
+            enable_console=not quiet,
+            debug_tracebacks=log_level == "DEBUG"
         )
         
         # Display banner
         if not quiet:
             _display_banner()
         
+        # An explicit --model-complexity takes precedence over --fast
+        if model_complexity is None:
+            model_complexity = 0 if fast else 1
+        
         # Create detection configuration
         config = DetectionConfig(
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
             model_complexity=model_complexity,
             enable_segmentation=enable_segmentation,
-            smooth_landmarks=not no_smooth_landmarks
+            smooth_landmarks=not no_smooth_landmarks,
+            static_frame_threshold=static_threshold,
+            model_asset_path=model_asset,
+            use_gpu=gpu
         )
         
         # Display configuration
         if not quiet:
             _display_config(config, input_path, output_dir)
         
+        # Leave CPU headroom for MediaPipe's own inference threads
+        if cv_threads is None:
+            cv_threads = max(1, (os.cpu_count() or 2) // 2)
+        cv2.setNumThreads(cv_threads)
+        
         # Process input
         with PoseProcessor(
             config=config,
             output_dir=output_dir,
             save_frames=not no_frames,
             save_overlays=not no_overlays,
-            show_progress=not no_progress and not quiet
+            show_progress=not no_progress and not quiet,
+            workers=workers,
+            skip_frames=skip_frames,
+            jpeg_quality=jpeg_quality
         ) as processor:
             stats = processor.process_input(
                 input_path=input_path,
@@ -213,7 +288,11 @@ def _display_config(config: DetectionConfig, input_path: Path, output_dir: Path)
     config_text.append(f"  Output: {output_dir}\n")
     config_text.append(f"  Detection confidence: {config.min_detection_confidence}\n")
     config_text.append(f"  Tracking confidence: {config.min_tracking_confidence}\n")
-    config_text.append(f"  Model complexity: {config.model_complexity}\n")
+    if config.model_asset_path is not None:
+        device = "GPU, CPU fallback" if config.use_gpu else "CPU"
+        config_text.append(f"  Model: {config.model_asset_path} ({device})\n")
+    else:
+        config_text.append(f"  Model complexity: {config.model_complexity}\n")
     config_text.append(f"  Segmentation: {config.enable_segmentation}\n")
     config_text.append(f"  Smooth landmarks: {config.smooth_landmarks}")
     
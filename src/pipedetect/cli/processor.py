@@ -1,25 +1,74 @@
 """Main pose processing orchestrator."""
 
+import multiprocessing
+import queue
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Iterator, Optional
+from typing import Any, Callable, Deque, List, Iterator, Optional, Tuple
 
 import cv2
+import numpy as np
 from loguru import logger
 
 from ..core.models import (
-    DetectionConfig, PoseResult, ProcessingStats, OutputPaths
+    DetectionConfig, PoseResult, ProcessingStats, OutputPaths,
+    landmarks_to_array, pose_confidence
 )
 from ..core.exceptions import PipeDetectError, ValidationError, FileProcessingError
 from ..detection.pose_detector import PoseDetector
+from ..detection.landmark_tracker import LandmarkTracker
+from ..detection.frame_change import FrameChangeDetector
 from ..io.validators import InputValidator
-from ..io.exporters import JSONExporter, CSVExporter
-from ..io.file_manager import FileManager
+from ..io.exporters import JSONExporter, CSVExporter, ResultStream
+from ..io.file_manager import DEFAULT_JPEG_QUALITY, FileManager
 from ..visualization.overlay_renderer import OverlayRenderer
 from ..visualization.progress_tracker import ProgressTracker
 from ..utils.performance import PerformanceProfiler
 
+# End-of-stream marker passed between pipeline stages
+_SENTINEL = object()
+
+# Seconds between stop-event checks while blocked on a pipeline queue
+_QUEUE_POLL_INTERVAL = 0.1
+
+# Detector owned by an image worker process
+_worker_detector: Optional[PoseDetector] = None
+
+
+def _init_detection_worker(config: DetectionConfig) -> None:
+    """Build the pose detector for an image worker process.
+    
+    Args:
+        config: Detection configuration
+    """
+    global _worker_detector
+    
+    # Workers only report problems; the parent process owns normal logging
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    
+    _worker_detector = PoseDetector(config, num_workers=1)
+
+
+def _detect_image_chunk(chunk: List[Tuple[int, Path]]) -> List[Tuple[Path, Optional[PoseResult]]]:
+    """Detect poses in a chunk of image files inside a worker process.
+    
+    Args:
+        chunk: (frame_id, image path) pairs
+        
+    Returns:
+        (image path, PoseResult or None) pairs in chunk order
+    """
+    return [
+        (image_path, _worker_detector.detect_single_image(image_path, frame_id))
+        for frame_id, image_path in chunk
+    ]
+
 
 class PoseProcessor:
     """Main processor for pose detection pipeline."""
@@ -29,7 +78,13 @@ class PoseProcessor:
                  output_dir: Path,
                  save_frames: bool = True,
                  save_overlays: bool = True,
-                 show_progress: bool = True):
+                 show_progress: bool = True,
+                 prefetch: int = 8,
+                 batch_size: int = 8,
+                 io_workers: int = 4,
+                 workers: int = 1,
+                 skip_frames: int = 1,
+                 jpeg_quality: int = DEFAULT_JPEG_QUALITY):
         """Initialize pose processor.
         
         Args:
@@ -38,23 +93,51 @@ class PoseProcessor:
             save_frames: Whether to save individual frames
             save_overlays: Whether to save overlay frames
             show_progress: Whether to show progress bar
+            prefetch: Maximum frames buffered between video pipeline stages
+            batch_size: Number of images detected concurrently in directory mode
+            io_workers: Threads encoding and writing output images
+            workers: Worker processes for image directories (1 = in-process)
+            skip_frames: Run pose detection every N video frames and track
+                landmarks with optical flow in between (1 = detect every frame)
+            jpeg_quality: JPEG quality (0-100) of saved frames and overlays
         """
         self.config = config
         self.output_dir = output_dir
         self.save_frames = save_frames
         self.save_overlays = save_overlays
         self.show_progress = show_progress
+        self.prefetch = prefetch
+        self.batch_size = batch_size
+        self.workers = workers
+        self.skip_frames = skip_frames
+        self.jpeg_quality = jpeg_quality
         
-        # Initialize components
-        self.pose_detector = PoseDetector(config)
+        # Initialize components; the pose detector is built on first use, since
+        # multiprocess image runs detect only in their workers
+        self._pose_detector: Optional[PoseDetector] = None
         self.overlay_renderer = OverlayRenderer()
         self.json_exporter = JSONExporter()
         self.csv_exporter = CSVExporter()
         self.progress_tracker = ProgressTracker() if show_progress else None
         self.profiler = PerformanceProfiler()
         
+        # Image encoding and disk writes run off the processing loop
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=io_workers,
+            thread_name_prefix="pipedetect-io"
+        )
+        self._pending_io: Deque[Future] = deque()
+        self._max_pending_io = io_workers * 2
+        
         logger.info("PoseProcessor initialized")
     
+    @property
+    def pose_detector(self) -> PoseDetector:
+        """In-process pose detector, created on first access."""
+        if self._pose_detector is None:
+            self._pose_detector = PoseDetector(self.config)
+        return self._pose_detector
+    
     def process_input(self, 
                      input_path: Path,
                      json_output: Optional[str] = None,
@@ -94,31 +177,53 @@ class PoseProcessor:
             
             # Process based on input type
             if input_type == 'video':
-                results = list(self._process_video(input_path, output_paths))
+                results = self._process_video(input_path, output_paths)
             elif input_type == 'image':
-                results = list(self._process_single_image(input_path, output_paths))
+                results = self._process_single_image(input_path, output_paths)
             elif input_type == 'directory':
-                results = list(self._process_image_directory(input_path, output_paths))
+                results = self._process_image_directory(input_path, output_paths)
             else:
                 raise ValidationError(f"Unsupported input type: {input_type}")
             
-            # Stop profiling
-            performance_metrics = self.profiler.stop()
-            end_time = datetime.now()
-            
-            # Create processing statistics
-            stats = ProcessingStats(
-                total_frames=performance_metrics.frames_processed,
-                processed_frames=len(results),
-                failed_frames=performance_metrics.frames_processed - len(results),
-                processing_time=performance_metrics.processing_time,
-                fps=performance_metrics.fps,
-                start_time=start_time,
-                end_time=end_time
-            )
+            # Stream results to the exporters as they are produced
+            json_stream = self.json_exporter.open_stream(output_paths.json_file)
+            csv_stream = self.csv_exporter.open_stream(output_paths.csv_file)
             
-            # Export results
-            self._export_results(results, output_paths, stats)
+            try:
+                processed_frames = 0
+                for result in results:
+                    json_stream.write(result)
+                    csv_stream.write(result)
+                    processed_frames += 1
+                
+                # Wait for queued frame writes before reporting
+                self._drain_io()
+                
+                # Stop profiling
+                performance_metrics = self.profiler.stop()
+                end_time = datetime.now()
+                
+                # Create processing statistics
+                stats = ProcessingStats(
+                    total_frames=performance_metrics.frames_processed,
+                    processed_frames=processed_frames,
+                    failed_frames=performance_metrics.frames_processed - processed_frames,
+                    processing_time=performance_metrics.processing_time,
+                    fps=performance_metrics.fps,
+                    start_time=start_time,
+                    end_time=end_time
+                )
+                
+                # Export results
+                self._export_results(json_stream, csv_stream, output_paths, stats)
+                
+            except BaseException:
+                json_stream.discard()
+                csv_stream.discard()
+                raise
+            finally:
+                # Stop pipeline threads if export failed mid-stream
+                results.close()
             
             # Cleanup empty directories
             FileManager.cleanup_empty_directories(output_paths)
@@ -138,6 +243,12 @@ class PoseProcessor:
     def _process_video(self, video_path: Path, output_paths: OutputPaths) -> Iterator[PoseResult]:
         """Process video file.
         
+        Decoding, pose detection and frame output run as a three-stage
+        pipeline: a reader thread decodes frames, the calling thread runs
+        MediaPipe (its graph is not thread-safe), and a writer thread renders
+        overlays and saves frames. Stages are connected by bounded queues so
+        memory stays flat while the slowest stage sets the pace.
+        
         Args:
             video_path: Path to video file
             output_paths: Output file paths
@@ -146,84 +257,257 @@ class PoseProcessor:
             PoseResult for each detected pose
         """
         try:
-            # Get video info for progress tracking
-            cap = cv2.VideoCapture(str(video_path))
+            # Process ALL video frames starting from frame 0
+            cap = PoseDetector.open_video(video_path)
+            
+            # Read before the reader thread starts; the capture is not shared afterwards
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            cap.release()
+            fps = PoseDetector.get_video_fps(cap)
             
             if self.progress_tracker:
                 self.progress_tracker.start(total_frames, f"Processing {video_path.name}")
             
-            # Process ALL video frames starting from frame 0
-            cap = cv2.VideoCapture(str(video_path))
-            if not cap.isOpened():
-                raise FileProcessingError(f"Cannot open video: {video_path}")
+            frame_queue: queue.Queue = queue.Queue(maxsize=self.prefetch)
+            write_queue: queue.Queue = queue.Queue(maxsize=self.prefetch)
+            stop_event = threading.Event()
+            errors: List[BaseException] = []
+            
+            reader = threading.Thread(
+                target=self._read_frames,
+                args=(cap, frame_queue, stop_event, errors),
+                name="pipedetect-reader",
+                daemon=True
+            )
+            writer = threading.Thread(
+                target=self._write_frames,
+                args=(write_queue, output_paths, stop_event, errors),
+                name="pipedetect-writer",
+                daemon=True
+            )
+            
+            # Between detections, landmarks are propagated with optical flow
+            tracker = LandmarkTracker() if self.skip_frames > 1 else None
+            
+            # Near-identical frames reuse the last detection when enabled
+            change_detector = None
+            if self.config.static_frame_threshold > 0:
+                change_detector = FrameChangeDetector(self.config.static_frame_threshold)
+            detected_landmarks = None
             
-            saved_frame_counter = 0
-            detected_poses = []
+            # Resolve per-frame callables and constants once, outside the loop
+            queue_get = self._queue_get
+            queue_put = self._queue_put
+            count_frame = self.profiler.increment_frame_count
+            detect_pose = self.pose_detector._mediapipe.detect_pose
+            skip_frames = self.skip_frames
+            source_file = str(video_path)
+            
+            reader.start()
+            writer.start()
             
             try:
                 while True:
-                    ret, frame = cap.read()
-                    if not ret:
+                    item = queue_get(frame_queue, stop_event)
+                    if item is _SENTINEL:
                         break
+                    saved_frame_counter, frame = item
                     
-                    self.profiler.increment_frame_count()
-                    
-                    # Save original frame if requested (ALL frames, starting from 0)
-                    if self.save_frames:
-                        FileManager.save_frame(frame, output_paths.frames_dir, saved_frame_counter)
+                    count_frame()
                     
-                    # Try to detect pose in this frame
-                    landmarks = self.pose_detector._mediapipe.detect_pose(frame)
+                    # Track from the previous frame on skipped frames, detect otherwise
+                    landmarks = None
+                    if tracker is not None and saved_frame_counter % skip_frames:
+                        landmarks = tracker.track(frame)
+                    if landmarks is None:
+                        if change_detector is not None and change_detector.unchanged(frame):
+                            landmarks = detected_landmarks
+                        else:
+                            landmarks = detect_pose(frame, saved_frame_counter * 1000.0 / fps)
+                            detected_landmarks = landmarks
+                    if tracker is not None:
+                        tracker.update(frame, landmarks)
                     
+                    result = None
                     if landmarks is not None:
                         # Calculate confidence
-                        confidence = sum(lm.visibility for lm in landmarks) / len(landmarks)
+                        points = landmarks_to_array(landmarks)
+                        confidence = pose_confidence(points)
                         
                         # Create pose result
-                        fps = cap.get(cv2.CAP_PROP_FPS)
                         result = PoseResult(
                             frame_id=saved_frame_counter,  # Use sequential frame number
                             timestamp=saved_frame_counter / fps,
-                            landmarks=landmarks,
+                            landmarks=points,
                             confidence=confidence,
-                            source_file=str(video_path)
+                            source_file=source_file
                         )
-                        
-                        detected_poses.append(result)
-                        
-                        # Save overlay frame if requested
-                        if self.save_overlays:
-                            overlay_frame = self.overlay_renderer.render_pose_with_confidence(
-                                frame, result
-                            )
-                            FileManager.save_overlay_frame(
-                                overlay_frame, output_paths.overlay_dir, saved_frame_counter
-                            )
-                    else:
-                        # No pose detected, but still save overlay frame with just the original frame
-                        if self.save_overlays:
-                            FileManager.save_overlay_frame(
-                                frame, output_paths.overlay_dir, saved_frame_counter
-                            )
                     
-                    if self.progress_tracker:
-                        self.progress_tracker.update()
-                    
-                    saved_frame_counter += 1
+                    # Hand the frame to the writer stage
+                    if not queue_put(write_queue, (saved_frame_counter, frame, result), stop_event):
+                        break
                     
+                    # Results stream out while later frames are still decoding
+                    if result is not None:
+                        yield result
+                
+                self._queue_put(write_queue, _SENTINEL, stop_event)
+                
+            except BaseException:
+                stop_event.set()
+                raise
+                
             finally:
+                writer.join()
+                stop_event.set()
+                reader.join()
                 cap.release()
             
-            # Yield all detected poses
-            for result in detected_poses:
-                yield result
+            if errors:
+                raise errors[0]
                 
         finally:
             if self.progress_tracker:
                 self.progress_tracker.finish()
     
+    def _read_frames(self,
+                     cap: cv2.VideoCapture,
+                     frame_queue: queue.Queue,
+                     stop_event: threading.Event,
+                     errors: List[BaseException]) -> None:
+        """Reader stage: decode frames and feed them to the detection stage.
+        
+        Args:
+            cap: Opened video capture
+            frame_queue: Queue receiving (frame_index, frame) tuples
+            stop_event: Event signalling pipeline shutdown
+            errors: Shared list collecting stage exceptions
+        """
+        try:
+            frame_index = 0
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                if not self._queue_put(frame_queue, (frame_index, frame), stop_event):
+                    break
+                frame_index += 1
+        except Exception as e:
+            errors.append(FileProcessingError(f"Failed to read video frame: {str(e)}"))
+            stop_event.set()
+        finally:
+            self._queue_put(frame_queue, _SENTINEL, stop_event)
+    
+    def _write_frames(self,
+                      write_queue: queue.Queue,
+                      output_paths: OutputPaths,
+                      stop_event: threading.Event,
+                      errors: List[BaseException]) -> None:
+        """Writer stage: render overlays and save frames to disk.
+        
+        Args:
+            write_queue: Queue of (frame_index, frame, PoseResult or None) tuples
+            output_paths: Output file paths
+            stop_event: Event signalling pipeline shutdown
+            errors: Shared list collecting stage exceptions
+        """
+        # Overlay buffers are recycled once _max_pending_io newer ones
+        # exist. This relies on _submit_io: it leaves at most _max_pending_io
+        # writes unfinished, always the most recently submitted ones, so any
+        # older buffer's write has completed. Change the two limits together.
+        overlay_buffers: Deque[np.ndarray] = deque()
+        
+        # Resolve per-frame callables once, outside the loop
+        queue_get = self._queue_get
+        submit_io = self._submit_io
+        render = self.overlay_renderer.render_pose_with_confidence
+        save_frame_path = FileManager.save_frame_path
+        jpeg_quality = self.jpeg_quality
+        frame_template = FileManager.frame_path_template(output_paths.frames_dir, "frame")
+        overlay_template = FileManager.frame_path_template(output_paths.overlay_dir, "overlay")
+        update_progress = self.progress_tracker.update if self.progress_tracker else None
+        
+        try:
+            while True:
+                item = queue_get(write_queue, stop_event)
+                if item is _SENTINEL:
+                    break
+                saved_frame_counter, frame, result = item
+                
+                # Save original frame if requested (ALL frames, starting from 0)
+                if self.save_frames:
+                    submit_io(save_frame_path, frame,
+                              frame_template % saved_frame_counter, jpeg_quality)
+                
+                # Save overlay frame if requested; frames without a pose are saved as-is
+                if self.save_overlays:
+                    if result is not None:
+                        buffer = None
+                        if len(overlay_buffers) > self._max_pending_io:
+                            buffer = overlay_buffers.popleft()
+                        if buffer is None or buffer.shape != frame.shape:
+                            buffer = np.empty_like(frame)
+                        overlay_frame = render(frame, result, out=buffer)
+                        overlay_buffers.append(buffer)
+                    else:
+                        overlay_frame = frame
+                    submit_io(save_frame_path, overlay_frame,
+                              overlay_template % saved_frame_counter, jpeg_quality)
+                
+                if update_progress:
+                    update_progress()
+        except Exception as e:
+            errors.append(e)
+            stop_event.set()
+    
+    def _submit_io(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run an output write on the I/O pool.
+        
+        The number of in-flight writes is bounded so queued frames cannot
+        pile up in memory; waiting on a finished write re-raises its error.
+        Writes older than the newest _max_pending_io submissions are always
+        finished on return, which _write_frames relies on to reuse buffers.
+        
+        Args:
+            fn: Write function
+            *args: Arguments for the write function
+        """
+        self._pending_io.append(self._io_pool.submit(fn, *args))
+        
+        while self._pending_io and (
+            self._pending_io[0].done() or len(self._pending_io) > self._max_pending_io
+        ):
+            self._pending_io.popleft().result()
+    
+    def _drain_io(self) -> None:
+        """Wait for all queued output writes, re-raising the first failure."""
+        while self._pending_io:
+            self._pending_io.popleft().result()
+    
+    @staticmethod
+    def _queue_put(q: queue.Queue, item: object, stop_event: threading.Event) -> bool:
+        """Put an item on a bounded queue, giving up once the pipeline stops.
+        
+        Returns:
+            True if the item was queued
+        """
+        while True:
+            try:
+                q.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                if stop_event.is_set():
+                    return False
+    
+    @staticmethod
+    def _queue_get(q: queue.Queue, stop_event: threading.Event) -> object:
+        """Get an item from a queue, returning the sentinel once the pipeline stops."""
+        while True:
+            try:
+                return q.get(timeout=_QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                if stop_event.is_set():
+                    return _SENTINEL
+    
     def _process_single_image(self, image_path: Path, output_paths: OutputPaths) -> Iterator[PoseResult]:
         """Process single image file.
         
@@ -238,24 +522,28 @@ class PoseProcessor:
             self.progress_tracker.start(1, f"Processing {image_path.name}")
         
         try:
-            result = self.pose_detector.detect_single_image(image_path)
+            # Decode once; the same pixels feed detection and the overlay
+            image = self.pose_detector.load_image(image_path)
+            result = self.pose_detector.detect_image(image, image_path)
             self.profiler.increment_frame_count()
             
             if result is not None:
                 # Save original image copy if requested (always use 0 for single image)
                 if self.save_frames:
-                    FileManager.save_image_copy(image_path, output_paths.frames_dir, 0)
+                    self._submit_io(
+                        FileManager.save_image_copy, image_path, output_paths.frames_dir, 0
+                    )
                 
                 # Save overlay image if requested (always use 0 for single image)
                 if self.save_overlays:
-                    image = cv2.imread(str(image_path))
-                    if image is not None:
-                        overlay_image = self.overlay_renderer.render_pose_with_confidence(
-                            image, result
-                        )
-                        FileManager.save_overlay_frame(
-                            overlay_image, output_paths.overlay_dir, 0
-                        )
+                    # The decoded image is not used again, so draw on it directly
+                    overlay_image = self.overlay_renderer.render_pose_with_confidence(
+                        image, result, out=image
+                    )
+                    self._submit_io(
+                        FileManager.save_overlay_frame,
+                        overlay_image, output_paths.overlay_dir, 0, self.jpeg_quality
+                    )
                 
                 yield result
             
@@ -282,54 +570,123 @@ class PoseProcessor:
         if self.progress_tracker:
             self.progress_tracker.start(len(image_files), f"Processing {dir_path.name}")
         
+        # Resolve per-image callables once, outside the loop
+        count_frame = self.profiler.increment_frame_count
+        submit_io = self._submit_io
+        render = self.overlay_renderer.render_pose_with_confidence
+        save_image_copy = FileManager.save_image_copy
+        save_frame_path = FileManager.save_frame_path
+        jpeg_quality = self.jpeg_quality
+        overlay_template = FileManager.frame_path_template(output_paths.overlay_dir, "overlay")
+        update_progress = self.progress_tracker.update if self.progress_tracker else None
+        
         try:
             saved_frame_counter = 0  # Counter for saved frames starting from 0
-            for frame_id, image_path in enumerate(image_files):
-                result = self.pose_detector.detect_single_image(image_path, frame_id)
-                self.profiler.increment_frame_count()
+            for image_path, image, result in self._detect_image_files(image_files):
+                count_frame()
                 
                 if result is not None:
                     # Save original image copy if requested (using sequential counter)
                     if self.save_frames:
-                        FileManager.save_image_copy(image_path, output_paths.frames_dir, saved_frame_counter)
+                        submit_io(save_image_copy, image_path,
+                                  output_paths.frames_dir, saved_frame_counter)
                     
                     # Save overlay image if requested (using sequential counter)
                     if self.save_overlays:
-                        image = cv2.imread(str(image_path))
-                        if image is not None:
-                            overlay_image = self.overlay_renderer.render_pose_with_confidence(
-                                image, result
-                            )
-                            FileManager.save_overlay_frame(
-                                overlay_image, output_paths.overlay_dir, saved_frame_counter
-                            )
+                        if image is None:
+                            image = PoseDetector.load_image(image_path)
+                        # The decoded image is not used again, so draw on it directly
+                        overlay_image = render(image, result, out=image)
+                        submit_io(save_frame_path, overlay_image,
+                                  overlay_template % saved_frame_counter, jpeg_quality)
                     
                     saved_frame_counter += 1  # Increment counter for saved frames
                     yield result
                 
-                if self.progress_tracker:
-                    self.progress_tracker.update()
+                if update_progress:
+                    update_progress()
                 
         finally:
             if self.progress_tracker:
                 self.progress_tracker.finish()
     
+    def _detect_image_files(
+        self, image_files: List[Path]
+    ) -> Iterator[Tuple[Path, Optional[np.ndarray], Optional[PoseResult]]]:
+        """Detect poses in image files, in file order.
+        
+        Args:
+            image_files: Image file paths
+            
+        Yields:
+            Tuple of (image path, decoded image or None, PoseResult or None)
+        """
+        if self.workers > 1:
+            yield from self._detect_image_files_multiprocess(image_files)
+            return
+        
+        for batch_start in range(0, len(image_files), self.batch_size):
+            batch_paths = image_files[batch_start:batch_start + self.batch_size]
+            batch_images = [self.pose_detector.load_image(path) for path in batch_paths]
+            batch_results = self.pose_detector.detect_image_batch(
+                batch_images, batch_paths, batch_start
+            )
+            yield from zip(batch_paths, batch_images, batch_results)
+    
+    def _detect_image_files_multiprocess(
+        self, image_files: List[Path]
+    ) -> Iterator[Tuple[Path, Optional[np.ndarray], Optional[PoseResult]]]:
+        """Detect poses in image files using a pool of worker processes.
+        
+        Each worker builds its own PoseDetector once and handles chunks of
+        files. Decoded images stay in the workers, so None is yielded in
+        their place.
+        
+        Args:
+            image_files: Image file paths
+            
+        Yields:
+            Tuple of (image path, None, PoseResult or None)
+        """
+        indexed_files = list(enumerate(image_files))
+        chunks = [
+            indexed_files[start:start + self.batch_size]
+            for start in range(0, len(indexed_files), self.batch_size)
+        ]
+        
+        # Spawn rather than fork: MediaPipe graphs and our I/O threads do not survive fork
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_detection_worker,
+            initargs=(self.config,)
+        )
+        
+        try:
+            for chunk_results in executor.map(_detect_image_chunk, chunks):
+                for image_path, result in chunk_results:
+                    yield image_path, None, result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def _export_results(self, 
-                       results: List[PoseResult], 
+                       json_stream: ResultStream,
+                       csv_stream: ResultStream,
                        output_paths: OutputPaths,
                        stats: ProcessingStats) -> None:
-        """Export processing results.
+        """Finish the streamed result exports.
         
         Args:
-            results: List of pose detection results
+            json_stream: JSON result stream
+            csv_stream: CSV result stream
             output_paths: Output file paths
             stats: Processing statistics
         """
         try:
             # Export JSON
-            if results:
-                self.json_exporter.export(results, output_paths.json_file, stats)
-                self.csv_exporter.export(results, output_paths.csv_file, stats)
+            if stats.processed_frames:
+                json_stream.finish(stats)
+                csv_stream.finish(stats)
                 
                 logger.info(f"Results exported:")
                 logger.info(f"  JSON: {output_paths.json_file}")
@@ -340,6 +697,8 @@ class PoseProcessor:
                 if self.save_overlays:
                     logger.info(f"  Overlays: {output_paths.overlay_dir}")
             else:
+                json_stream.discard()
+                csv_stream.discard()
                 logger.warning("No pose detection results to export")
                 
         except Exception as e:
@@ -348,7 +707,11 @@ class PoseProcessor:
     
     def close(self) -> None:
         """Clean up resources."""
-        self.pose_detector.close()
+        self._io_pool.shutdown(wait=True)
+        self._pending_io.clear()
+        if self._pose_detector is not None:
+            self._pose_detector.close()
+            self._pose_detector = None
         logger.info("PoseProcessor closed")
     
     def __enter__(self):
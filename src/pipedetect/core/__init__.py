@@ -1,12 +1,14 @@
 """Core business logic and data models."""
 
-from .models import PoseResult, DetectionConfig, LandmarkPoint
+from .models import PoseResult, DetectionConfig, LandmarkPoint, landmarks_to_array, pose_confidence
 from .exceptions import PipeDetectError, DetectionError, ValidationError
 
 __all__ = [
     "PoseResult", 
     "DetectionConfig", 
     "LandmarkPoint",
+    "landmarks_to_array",
+    "pose_confidence",
     "PipeDetectError",
     "DetectionError", 
     "ValidationError"
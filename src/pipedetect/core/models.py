@@ -3,13 +3,17 @@
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Union
 from enum import Enum
 
 import numpy as np
 from pydantic import BaseModel, Field, field_validator
 
 
+# Per-landmark values, in column order of landmark arrays
+LANDMARK_FIELDS = ("x", "y", "z", "visibility", "presence")
+
+
 class OutputFormat(str, Enum):
     """Supported output formats."""
     JSON = "json"
@@ -25,15 +29,60 @@ class LandmarkPoint(BaseModel):
     presence: float = Field(..., description="Presence score")
 
 
+def landmarks_to_array(landmarks: Union[np.ndarray, Sequence[LandmarkPoint]]) -> np.ndarray:
+    """Pack landmarks into a single array for vectorized processing.
+    
+    Args:
+        landmarks: Pose landmarks, or an array that is already packed
+        
+    Returns:
+        Array of shape (N, 5) with columns ordered as LANDMARK_FIELDS
+    """
+    if isinstance(landmarks, np.ndarray):
+        return np.asarray(landmarks, dtype=np.float64).reshape(-1, len(LANDMARK_FIELDS))
+    
+    return np.array(
+        [(lm.x, lm.y, lm.z, lm.visibility, lm.presence) for lm in landmarks],
+        dtype=np.float64
+    ).reshape(-1, len(LANDMARK_FIELDS))
+
+
+def pose_confidence(points: np.ndarray) -> float:
+    """Overall pose confidence: the mean landmark visibility.
+    
+    Equivalent to ``float(points[:, 3].mean())`` but skips the dispatch
+    overhead of ndarray.mean, which dominates for a 33-row array.
+    
+    Args:
+        points: Non-empty landmark array with columns LANDMARK_FIELDS
+        
+    Returns:
+        Mean visibility across landmarks
+    """
+    return float(np.add.reduce(points[:, 3])) / len(points)
+
+
 class PoseResult(BaseModel):
     """Complete pose detection result for a single frame."""
     frame_id: int = Field(..., description="Frame number")
     timestamp: float = Field(..., description="Timestamp in seconds")
-    landmarks: List[LandmarkPoint] = Field(..., description="Pose landmarks")
+    landmarks: np.ndarray = Field(
+        ..., description="Pose landmarks as an (N, 5) array with columns LANDMARK_FIELDS"
+    )
     confidence: float = Field(..., description="Overall pose confidence")
     source_file: str = Field(..., description="Source file path")
     
     model_config = {"arbitrary_types_allowed": True}
+    
+    @field_validator('landmarks', mode='before')
+    @classmethod
+    def pack_landmarks(cls, v):
+        """Store landmarks as a single array rather than one object per point."""
+        if isinstance(v, np.ndarray) and (v.ndim != 2 or v.shape[1] != len(LANDMARK_FIELDS)):
+            raise ValueError(
+                f'Landmark array must have shape (N, {len(LANDMARK_FIELDS)}), got {v.shape}'
+            )
+        return landmarks_to_array(v)
         
     @field_validator('confidence')
     @classmethod
@@ -72,6 +121,21 @@ class DetectionConfig(BaseModel):
         default=True,
         description="Apply landmark smoothing"
     )
+    static_frame_threshold: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=255.0,
+        description="Reuse the previous video landmarks while frames differ from the "
+                    "last detected frame by less than this mean grayscale level (0=off)"
+    )
+    model_asset_path: Optional[Path] = Field(
+        default=None,
+        description="PoseLandmarker .task model; selects the MediaPipe Tasks API backend"
+    )
+    use_gpu: bool = Field(
+        default=True,
+        description="Try the GPU delegate for the Tasks API model, falling back to CPU"
+    )
 
 
 @dataclass
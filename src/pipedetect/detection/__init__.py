@@ -2,5 +2,7 @@
 
 from .pose_detector import PoseDetector
 from .mediapipe_wrapper import MediaPipeWrapper
+from .landmark_tracker import LandmarkTracker
+from .frame_change import FrameChangeDetector
 
-__all__ = ["PoseDetector", "MediaPipeWrapper"] 
\ No newline at end of file
+__all__ = ["PoseDetector", "MediaPipeWrapper", "LandmarkTracker", "FrameChangeDetector"] 
\ No newline at end of file
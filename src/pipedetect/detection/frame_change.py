@@ -0,0 +1,53 @@
+"""Cheap scene-change detection for skipping redundant pose inference."""
+
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+class FrameChangeDetector:
+    """Flags frames that barely differ from the last frame sent to inference.
+    
+    Frames are reduced to a small grayscale thumbnail and compared by mean
+    absolute difference, which costs a resize and a 1024-element reduction
+    instead of a MediaPipe forward pass. The reference thumbnail is only
+    replaced when a frame counts as changed, so slow drift over many frames
+    still triggers a new detection.
+    """
+    
+    def __init__(self, threshold: float, size: int = 32):
+        """Initialize frame change detector.
+        
+        Args:
+            threshold: Mean absolute grayscale difference (0-255) below which
+                a frame counts as unchanged
+            size: Side length of the comparison thumbnail
+        """
+        self.threshold = threshold
+        self._size = (size, size)
+        self._reference: Optional[np.ndarray] = None
+    
+    def unchanged(self, frame: np.ndarray) -> bool:
+        """Check a frame against the reference, adopting it if it changed.
+        
+        Args:
+            frame: Frame to check (BGR format)
+            
+        Returns:
+            True if the previous detection can be reused for this frame
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumbnail = cv2.resize(gray, self._size, interpolation=cv2.INTER_AREA)
+        
+        if self._reference is not None:
+            difference = cv2.norm(thumbnail, self._reference, cv2.NORM_L1) / thumbnail.size
+            if difference < self.threshold:
+                return True
+        
+        self._reference = thumbnail
+        return False
+    
+    def reset(self) -> None:
+        """Forget the reference frame."""
+        self._reference = None
@@ -0,0 +1,103 @@
+"""Optical-flow landmark propagation between pose detections."""
+
+from typing import Optional, Sequence, Union
+
+import cv2
+import numpy as np
+from loguru import logger
+
+from ..core.models import LandmarkPoint, landmarks_to_array
+
+
+class LandmarkTracker:
+    """Propagates pose landmarks from frame to frame with Lucas-Kanade optical flow.
+    
+    Used to fill in frames between MediaPipe detections when frame skipping
+    is enabled. Tracking is far cheaper than inference but drifts, so callers
+    should re-detect periodically and whenever tracking fails.
+    """
+    
+    def __init__(self,
+                 min_tracked_fraction: float = 0.5,
+                 window_size: int = 21,
+                 pyramid_levels: int = 3):
+        """Initialize landmark tracker.
+        
+        Args:
+            min_tracked_fraction: Fraction of landmarks that must be tracked
+                for a frame to count as a successful track
+            window_size: Search window size for optical flow
+            pyramid_levels: Number of pyramid levels for optical flow
+        """
+        self.min_tracked_fraction = min_tracked_fraction
+        self._lk_params = dict(
+            winSize=(window_size, window_size),
+            maxLevel=pyramid_levels,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03)
+        )
+        self._prev_gray: Optional[np.ndarray] = None
+        self._prev_landmarks: Optional[np.ndarray] = None
+    
+    def update(self,
+               frame: np.ndarray,
+               landmarks: Optional[Union[np.ndarray, Sequence[LandmarkPoint]]]) -> None:
+        """Set the reference frame and landmarks for the next track call.
+        
+        Args:
+            frame: Current frame (BGR format)
+            landmarks: Landmarks for the current frame, or None to reset
+        """
+        if landmarks is None:
+            self.reset()
+            return
+        
+        self._prev_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self._prev_landmarks = landmarks_to_array(landmarks)
+    
+    def track(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """Estimate landmarks in a new frame from the reference frame.
+        
+        Args:
+            frame: Next frame (BGR format)
+            
+        Returns:
+            Propagated landmark array, or None if there is no reference or
+            too few landmarks could be tracked
+        """
+        if self._prev_gray is None or self._prev_landmarks is None:
+            return None
+        
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if gray.shape != self._prev_gray.shape:
+            return None
+        
+        height, width = gray.shape
+        prev_points = (
+            (self._prev_landmarks[:, :2] * (width, height)).astype(np.float32).reshape(-1, 1, 2)
+        )
+        
+        next_points, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, prev_points, None, **self._lk_params
+        )
+        if next_points is None:
+            return None
+        
+        tracked = status.reshape(-1).astype(bool)
+        if tracked.mean() < self.min_tracked_fraction:
+            logger.opt(lazy=True).debug(
+                "Landmark tracking lost ({}/{} points)",
+                lambda: int(tracked.sum()), lambda: len(tracked)
+            )
+            return None
+        
+        # Points that could not be tracked keep their previous position
+        points = np.where(tracked[:, None], next_points.reshape(-1, 2), prev_points.reshape(-1, 2))
+        
+        landmarks = self._prev_landmarks.copy()
+        landmarks[:, :2] = points.astype(np.float64) / (width, height)
+        return landmarks
+    
+    def reset(self) -> None:
+        """Drop the reference frame and landmarks."""
+        self._prev_gray = None
+        self._prev_landmarks = None
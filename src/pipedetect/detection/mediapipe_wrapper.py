@@ -1,57 +1,174 @@
 """MediaPipe wrapper for pose detection."""
 
-from typing import Optional, List
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence, Union
 import cv2
 import numpy as np
-import mediapipe as mp
 from loguru import logger
 
-from ..core.models import DetectionConfig, LandmarkPoint
+from ..core.models import DetectionConfig, LandmarkPoint, landmarks_to_array
 from ..core.exceptions import DetectionError, ConfigurationError
 
 
+# Timestamp step used when a frame arrives without one (one frame at 30 FPS)
+_NOMINAL_FRAME_MS = 33
+
+
+@lru_cache(maxsize=4)
+def _read_model_asset(model_path: Path) -> bytes:
+    """Read a Tasks API model file once per process.
+    
+    Batch workers each build their own landmarker; they share these bytes
+    through model_asset_buffer instead of re-reading the file.
+    
+    Args:
+        model_path: Path to the .task model file
+        
+    Returns:
+        Model file contents
+    """
+    return Path(model_path).read_bytes()
+
+
 class MediaPipeWrapper:
-    """Wrapper around MediaPipe pose detection."""
+    """Wrapper around MediaPipe pose detection.
+    
+    Uses the legacy ``mp.solutions.pose`` graph by default. When the config
+    names a PoseLandmarker model file, the MediaPipe Tasks API is used in
+    video mode instead, which pipelines pre-processing, inference and
+    post-processing inside the graph and can run on the GPU delegate.
+    """
     
     def __init__(self, config: DetectionConfig):
         """Initialize MediaPipe pose detector.
         
+        MediaPipe itself is imported here rather than with the module, so
+        importing the package (the CLI, exporters, tests) does not pay for it.
+        
         Args:
             config: Detection configuration
         """
         self.config = config
-        self._mp_pose = mp.solutions.pose
-        self._mp_drawing = mp.solutions.drawing_utils
-        self._mp_drawing_styles = mp.solutions.drawing_styles
+        self._pose = None
+        self._landmarker = None
+        
+        # RGB conversion target, reused while the input size stays the same
+        self._rgb_buffer: Optional[np.ndarray] = None
+        
+        # Video-mode timestamps must strictly increase across every call
+        self._last_timestamp_ms = -_NOMINAL_FRAME_MS
+        self._timestamp_offset_ms = 0
         
         try:
-            self._pose = self._mp_pose.Pose(
-                static_image_mode=False,
-                model_complexity=config.model_complexity,
-                enable_segmentation=config.enable_segmentation,
-                smooth_landmarks=config.smooth_landmarks,
-                min_detection_confidence=config.min_detection_confidence,
-                min_tracking_confidence=config.min_tracking_confidence
-            )
+            if config.model_asset_path is not None:
+                self._create_landmarker(config)
+            else:
+                self._create_solution(config)
             logger.info(f"MediaPipe pose detector initialized with config: {config}")
         except Exception as e:
             raise ConfigurationError(f"Failed to initialize MediaPipe: {str(e)}")
     
-    def detect_pose(self, image: np.ndarray) -> Optional[List[LandmarkPoint]]:
+    def _create_solution(self, config: DetectionConfig) -> None:
+        """Build the legacy ``mp.solutions.pose`` graph.
+        
+        Args:
+            config: Detection configuration
+        """
+        import mediapipe as mp
+        
+        self._mp_pose = mp.solutions.pose
+        self._mp_drawing = mp.solutions.drawing_utils
+        self._mp_drawing_styles = mp.solutions.drawing_styles
+        self._pose_connections = self._mp_pose.POSE_CONNECTIONS
+        self._landmark_style = self._mp_drawing_styles.get_default_pose_landmarks_style()
+        
+        self._pose = self._mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=config.model_complexity,
+            enable_segmentation=config.enable_segmentation,
+            smooth_landmarks=config.smooth_landmarks,
+            min_detection_confidence=config.min_detection_confidence,
+            min_tracking_confidence=config.min_tracking_confidence
+        )
+        
+        # Landmark proto handed to the drawing utils, refilled on every draw
+        from mediapipe.framework.formats import landmark_pb2
+        self._landmark_proto = landmark_pb2.NormalizedLandmarkList()
+    
+    def _create_landmarker(self, config: DetectionConfig) -> None:
+        """Build a Tasks API PoseLandmarker running in video mode.
+        
+        With config.use_gpu the GPU delegate is tried first and the CPU
+        delegate is used if it cannot be created.
+        
+        Args:
+            config: Detection configuration
+        """
+        import mediapipe as mp
+        from mediapipe.tasks.python import BaseOptions, vision
+        from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
+        
+        self._mp_image = mp.Image
+        self._image_format = mp.ImageFormat.SRGB
+        self._mp_drawing = vision.drawing_utils
+        self._mp_drawing_styles = vision.drawing_styles
+        self._pose_connections = vision.PoseLandmarksConnections.POSE_LANDMARKS
+        self._landmark_style = self._mp_drawing_styles.get_default_pose_landmarks_style()
+        self._normalized_landmark = NormalizedLandmark
+        
+        model_asset = _read_model_asset(Path(config.model_asset_path))
+        
+        def create(delegate):
+            options = vision.PoseLandmarkerOptions(
+                base_options=BaseOptions(model_asset_buffer=model_asset, delegate=delegate),
+                running_mode=vision.RunningMode.VIDEO,
+                num_poses=1,
+                min_pose_detection_confidence=config.min_detection_confidence,
+                min_tracking_confidence=config.min_tracking_confidence,
+                output_segmentation_masks=config.enable_segmentation
+            )
+            return vision.PoseLandmarker.create_from_options(options)
+        
+        # Prefer the GPU delegate; it is missing on many platforms and builds
+        self._delegate = "CPU"
+        if config.use_gpu:
+            try:
+                self._landmarker = create(BaseOptions.Delegate.GPU)
+                self._delegate = "GPU"
+            except (RuntimeError, ValueError, NotImplementedError) as e:
+                logger.warning(f"GPU delegate unavailable, falling back to CPU: {e}")
+        if self._landmarker is None:
+            self._landmarker = create(BaseOptions.Delegate.CPU)
+        logger.info(f"MediaPipe pose landmarker running on {self._delegate}")
+    
+    def detect_pose(self,
+                    image: np.ndarray,
+                    timestamp_ms: Optional[float] = None) -> Optional[np.ndarray]:
         """Detect pose in a single image.
         
         Args:
             image: Input image as numpy array (BGR format)
+            timestamp_ms: Position of the frame in its video, used by the
+                Tasks API backend; frames without one are spaced one
+                nominal frame apart
             
         Returns:
-            List of landmark points or None if no pose detected
+            Landmark array of shape (33, 5) with columns LANDMARK_FIELDS,
+            or None if no pose detected
             
         Raises:
             DetectionError: If detection fails
         """
         try:
-            # Convert BGR to RGB
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            # Convert BGR to RGB into the reusable buffer; MediaPipe copies
+            # the pixels into its own packet, so the buffer is free on return
+            if self._rgb_buffer is None or self._rgb_buffer.shape != image.shape:
+                self._rgb_buffer = np.empty_like(image)
+            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+            
+            if self._landmarker is not None:
+                return self._detect_with_landmarker(rgb_image, timestamp_ms)
             
             # Perform pose detection
             results = self._pose.process(rgb_image)
@@ -59,57 +176,106 @@ class MediaPipeWrapper:
             if not results.pose_landmarks:
                 return None
                 
-            # Convert landmarks to our format
-            landmarks = []
-            for landmark in results.pose_landmarks.landmark:
-                landmarks.append(LandmarkPoint(
-                    x=landmark.x,
-                    y=landmark.y, 
-                    z=landmark.z,
-                    visibility=landmark.visibility,
-                    presence=getattr(landmark, 'presence', 1.0)  # Fallback for older versions
-                ))
-                
-            return landmarks
+            # Pack landmarks straight into an array, one row per landmark
+            return np.array(
+                [
+                    (landmark.x, landmark.y, landmark.z, landmark.visibility,
+                     getattr(landmark, 'presence', 1.0))  # Fallback for older versions
+                    for landmark in results.pose_landmarks.landmark
+                ],
+                dtype=np.float64
+            )
             
         except Exception as e:
             raise DetectionError(f"Pose detection failed: {str(e)}")
     
-    def draw_landmarks(self, image: np.ndarray, landmarks: List[LandmarkPoint]) -> np.ndarray:
+    def _detect_with_landmarker(self,
+                                rgb_image: np.ndarray,
+                                timestamp_ms: Optional[float]) -> Optional[np.ndarray]:
+        """Run the Tasks API PoseLandmarker on one RGB frame.
+        
+        Args:
+            rgb_image: Input image (RGB format)
+            timestamp_ms: Position of the frame in its video, if known
+            
+        Returns:
+            Landmark array of shape (33, 5), or None if no pose detected
+        """
+        mp_image = self._mp_image(image_format=self._image_format, data=rgb_image)
+        results = self._landmarker.detect_for_video(mp_image, self._next_timestamp_ms(timestamp_ms))
+        
+        if not results.pose_landmarks:
+            return None
+            
+        return np.array(
+            [
+                (landmark.x, landmark.y, landmark.z, landmark.visibility,
+                 1.0 if landmark.presence is None else landmark.presence)
+                for landmark in results.pose_landmarks[0]
+            ],
+            dtype=np.float64
+        )
+    
+    def _next_timestamp_ms(self, timestamp_ms: Optional[float]) -> int:
+        """Map a frame timestamp onto the graph's strictly increasing clock.
+        
+        A timestamp at or before the previous one means a new video started
+        on the same graph; its clock is shifted to continue after the last
+        frame so tracking state carries over as it does for the legacy graph.
+        
+        Args:
+            timestamp_ms: Position of the frame in its video, if known
+            
+        Returns:
+            Timestamp to pass to the landmarker
+        """
+        if timestamp_ms is None:
+            timestamp = self._last_timestamp_ms + _NOMINAL_FRAME_MS
+        else:
+            timestamp = int(timestamp_ms) + self._timestamp_offset_ms
+            if timestamp <= self._last_timestamp_ms:
+                shift = self._last_timestamp_ms + _NOMINAL_FRAME_MS - timestamp
+                self._timestamp_offset_ms += shift
+                timestamp += shift
+        
+        self._last_timestamp_ms = timestamp
+        return timestamp
+    
+    def draw_landmarks(self,
+                       image: np.ndarray,
+                       landmarks: Union[np.ndarray, Sequence[LandmarkPoint]]) -> np.ndarray:
         """Draw pose landmarks on image.
         
         Args:
             image: Input image
-            landmarks: Pose landmarks
+            landmarks: Pose landmarks, as points or an (N, 5) landmark array
             
         Returns:
             Image with drawn landmarks
         """
         try:
-            # Convert our landmarks back to MediaPipe format for drawing
-            mp_landmarks = self._mp_pose.PoseLandmark
-            landmark_list = []
-            
-            for lm in landmarks:
-                # Create a mock landmark object
-                mock_landmark = type('MockLandmark', (), {
-                    'x': lm.x, 'y': lm.y, 'z': lm.z, 
-                    'visibility': lm.visibility
-                })()
-                landmark_list.append(mock_landmark)
-            
-            # Create pose landmarks object
-            pose_landmarks = type('PoseLandmarks', (), {
-                'landmark': landmark_list
-            })()
+            rows = landmarks_to_array(landmarks).tolist()
+            if self._landmarker is not None:
+                normalized_landmark = self._normalized_landmark
+                pose_landmarks = [
+                    normalized_landmark(x=x, y=y, z=z, visibility=visibility, presence=presence)
+                    for x, y, z, visibility, presence in rows
+                ]
+            else:
+                # Refill the cached proto in place instead of building new objects
+                pose_landmarks = self._landmark_proto
+                pose_landmarks.ClearField('landmark')
+                add_landmark = pose_landmarks.landmark.add
+                for x, y, z, visibility, _ in rows:
+                    add_landmark(x=x, y=y, z=z, visibility=visibility)
             
             # Draw landmarks
             annotated_image = image.copy()
             self._mp_drawing.draw_landmarks(
                 annotated_image,
                 pose_landmarks,
-                self._mp_pose.POSE_CONNECTIONS,
-                landmark_drawing_spec=self._mp_drawing_styles.get_default_pose_landmarks_style()
+                self._pose_connections,
+                landmark_drawing_spec=self._landmark_style
             )
             
             return annotated_image
@@ -120,8 +286,13 @@ class MediaPipeWrapper:
     
     def close(self) -> None:
         """Clean up resources."""
-        if hasattr(self, '_pose'):
+        if self._landmarker is not None:
+            self._landmarker.close()
+            self._landmarker = None
+            logger.debug("MediaPipe pose landmarker closed")
+        if self._pose is not None:
             self._pose.close()
+            self._pose = None
             logger.debug("MediaPipe pose detector closed")
     
     def __enter__(self):
@@ -130,4 +301,4 @@ class MediaPipeWrapper:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close() 
\ No newline at end of file
+        self.close()
@@ -1,31 +1,126 @@
 """High-level pose detector interface."""
 
-from typing import List, Optional, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Iterator, Sequence, Tuple
 from pathlib import Path
+import os
+import queue
+import threading
 import time
 
 import cv2
 import numpy as np
 from loguru import logger
 
-from ..core.models import PoseResult, DetectionConfig, ProcessingStats
+from ..core.models import (
+    PoseResult, DetectionConfig, ProcessingStats, landmarks_to_array, pose_confidence
+)
 from ..core.exceptions import DetectionError, FileProcessingError
 from .mediapipe_wrapper import MediaPipeWrapper
+from .frame_change import FrameChangeDetector
+
+
+# Frame rate assumed for videos whose container does not report one
+DEFAULT_VIDEO_FPS = 30.0
+
+# Decoded frames buffered ahead of detection in detect_video
+VIDEO_PREFETCH_FRAMES = 4
+
+# Seconds between stop checks while the decoder is blocked on a full queue
+_DECODE_POLL_INTERVAL = 0.1
+
+# End-of-stream marker put on the decode queue
+_END_OF_VIDEO = object()
+
+# Image file extensions picked up by detect_batch_images (matched lowercased)
+_BATCH_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'})
 
 
 class PoseDetector:
     """High-level pose detector with batch processing capabilities."""
     
-    def __init__(self, config: DetectionConfig):
+    def __init__(self, config: DetectionConfig, num_workers: Optional[int] = None):
         """Initialize pose detector.
         
         Args:
             config: Detection configuration
+            num_workers: Worker threads used by detect_batch (default: CPU count)
         """
         self.config = config
+        self.num_workers = num_workers or os.cpu_count() or 1
         self._mediapipe = MediaPipeWrapper(config)
+        
+        # Batch workers each own a MediaPipe graph; graphs are not reentrant
+        self._batch_pool: Optional[ThreadPoolExecutor] = None
+        self._worker_local = threading.local()
+        self._worker_wrappers: List[MediaPipeWrapper] = []
+        self._worker_lock = threading.Lock()
+        
+        # Captures kept open for get_frame_from_video, keyed by video path
+        self._capture_cache: Dict[str, cv2.VideoCapture] = {}
+        self._capture_lock = threading.Lock()
+        
         logger.info("PoseDetector initialized")
     
+    @staticmethod
+    def load_image(image_path: Path) -> np.ndarray:
+        """Decode an image file.
+        
+        Args:
+            image_path: Path to image file
+            
+        Returns:
+            Image as numpy array (BGR format)
+            
+        Raises:
+            FileProcessingError: If image cannot be loaded
+        """
+        image = cv2.imread(str(image_path))
+        if image is None:
+            raise FileProcessingError(f"Cannot load image: {image_path}")
+        return image
+    
+    @staticmethod
+    def open_video(video_path: Path) -> cv2.VideoCapture:
+        """Open a video file for decoding.
+        
+        The FFmpeg backend is requested explicitly so OpenCV does not probe
+        other backends first; builds without it fall back to the default.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Opened video capture
+            
+        Raises:
+            FileProcessingError: If video cannot be opened
+        """
+        cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG)
+        if not cap.isOpened():
+            cap.release()
+            cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            cap.release()
+            raise FileProcessingError(f"Cannot open video: {video_path}")
+        return cap
+    
+    @staticmethod
+    def get_video_fps(cap: cv2.VideoCapture) -> float:
+        """Read the frame rate of an opened video.
+        
+        Args:
+            cap: Opened video capture
+            
+        Returns:
+            Frames per second, or DEFAULT_VIDEO_FPS if the video reports none
+        """
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        if not fps > 0:
+            logger.warning(f"Video reports no frame rate; assuming {DEFAULT_VIDEO_FPS:.0f} FPS")
+            return DEFAULT_VIDEO_FPS
+        return fps
+    
     def detect_single_image(self, image_path: Path, frame_id: int = 0) -> Optional[PoseResult]:
         """Detect pose in a single image file.
         
@@ -40,93 +135,241 @@ class PoseDetector:
             FileProcessingError: If image cannot be loaded
             DetectionError: If detection fails
         """
-        try:
-            # Load image
-            image = cv2.imread(str(image_path))
-            if image is None:
-                raise FileProcessingError(f"Cannot load image: {image_path}")
+        return self.detect_image(self.load_image(image_path), image_path, frame_id)
+    
+    def detect_image(self,
+                     image: np.ndarray,
+                     image_path: Path,
+                     frame_id: int = 0) -> Optional[PoseResult]:
+        """Detect pose in an already decoded image.
+        
+        Lets callers that also need the pixels (e.g. for overlays) decode
+        the file only once.
+        
+        Args:
+            image: Image as numpy array (BGR format)
+            image_path: Path of the source image file
+            frame_id: Frame identifier
             
-            # Detect pose
+        Returns:
+            PoseResult or None if no pose detected
+            
+        Raises:
+            DetectionError: If detection fails
+        """
+        try:
             landmarks = self._mediapipe.detect_pose(image)
-            if landmarks is None:
-                logger.debug(f"No pose detected in {image_path}")
-                return None
+            return self._create_image_result(image_path, landmarks, frame_id)
             
-            # Calculate confidence (simplified - use average visibility)
-            confidence = sum(lm.visibility for lm in landmarks) / len(landmarks)
+        except Exception as e:
+            if isinstance(e, DetectionError):
+                raise
+            raise DetectionError(f"Failed to process image {image_path}: {str(e)}")
+    
+    def detect_image_batch(self,
+                           images: Sequence[np.ndarray],
+                           image_paths: Sequence[Path],
+                           start_frame_id: int = 0) -> List[Optional[PoseResult]]:
+        """Detect poses in several decoded images concurrently.
+        
+        Args:
+            images: Images as numpy arrays (BGR format)
+            image_paths: Paths of the source image files
+            start_frame_id: Frame identifier of the first image
             
-            result = PoseResult(
-                frame_id=frame_id,
-                timestamp=0.0,  # Static image
-                landmarks=landmarks,
-                confidence=confidence,
-                source_file=str(image_path)
-            )
+        Returns:
+            PoseResult (or None if no pose detected) for each image, in input order
+            
+        Raises:
+            DetectionError: If detection fails
+        """
+        try:
+            landmarks_batch = self.detect_batch(images)
             
-            logger.debug(f"Pose detected in {image_path} with confidence {confidence:.3f}")
-            return result
+            return [
+                self._create_image_result(image_path, landmarks, start_frame_id + offset)
+                for offset, (image_path, landmarks) in enumerate(zip(image_paths, landmarks_batch))
+            ]
             
         except Exception as e:
-            if isinstance(e, (FileProcessingError, DetectionError)):
+            if isinstance(e, DetectionError):
                 raise
-            raise DetectionError(f"Failed to process image {image_path}: {str(e)}")
+            raise DetectionError(f"Failed to process image batch: {str(e)}")
+    
+    def _create_image_result(self,
+                             image_path: Path,
+                             landmarks: Optional[np.ndarray],
+                             frame_id: int) -> Optional[PoseResult]:
+        """Build the PoseResult for a static image.
+        
+        Args:
+            image_path: Path to image file
+            landmarks: Detected landmarks or None
+            frame_id: Frame identifier
+            
+        Returns:
+            PoseResult or None if no pose detected
+        """
+        if landmarks is None:
+            logger.debug("No pose detected in {}", image_path)
+            return None
+        
+        # Calculate confidence (simplified - use average visibility)
+        points = landmarks_to_array(landmarks)
+        confidence = pose_confidence(points)
+        
+        result = PoseResult(
+            frame_id=frame_id,
+            timestamp=0.0,  # Static image
+            landmarks=points,
+            confidence=confidence,
+            source_file=str(image_path)
+        )
+        
+        logger.debug("Pose detected in {} with confidence {:.3f}", image_path, confidence)
+        return result
     
-    def detect_video(self, video_path: Path) -> Iterator[Tuple[PoseResult, np.ndarray]]:
+    def detect_video(self,
+                     video_path: Path,
+                     stride: int = 1) -> Iterator[Tuple[PoseResult, np.ndarray]]:
         """Detect poses in video file.
         
+        Frames are decoded on a background thread into a small bounded
+        queue while MediaPipe runs on the calling thread.
+        
         Args:
             video_path: Path to video file
+            stride: Process every Nth frame; the frames in between are only
+                grabbed, skipping their conversion to BGR images
             
         Yields:
-            Tuple of (PoseResult, frame) for each frame with detected pose
+            Tuple of (PoseResult, frame) for each frame with detected pose;
+            the frame is not copied, but each read allocates a new array, so
+            it is never reused and callers may keep or modify it
             
         Raises:
             FileProcessingError: If video cannot be loaded
             DetectionError: If detection fails
+            ValueError: If stride is less than 1
         """
+        if stride < 1:
+            raise ValueError(f"stride must be at least 1, got {stride}")
+        
         cap = None
+        decoder = None
+        stop_event = threading.Event()
+        errors: List[BaseException] = []
         try:
-            cap = cv2.VideoCapture(str(video_path))
-            if not cap.isOpened():
-                raise FileProcessingError(f"Cannot open video: {video_path}")
+            cap = self.open_video(video_path)
             
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            actual_frame_number = 0
+            fps = self.get_video_fps(cap)
+            source_file = str(video_path)
             
             logger.info(f"Processing video {video_path} at {fps:.2f} FPS")
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            # Decode on a separate thread; cap.read() releases the GIL, so
+            # decoding the next frames overlaps with inference on this one
+            frame_queue: queue.Queue = queue.Queue(maxsize=VIDEO_PREFETCH_FRAMES)
+            decoder = threading.Thread(
+                target=self._decode_frames,
+                args=(cap, frame_queue, stop_event, errors, stride),
+                name="pipedetect-decoder",
+                daemon=True
+            )
+            decoder.start()
+            
+            # Near-identical frames reuse the last detection when enabled
+            change_detector = None
+            if self.config.static_frame_threshold > 0:
+                change_detector = FrameChangeDetector(self.config.static_frame_threshold)
+            
+            detect_pose = self._mediapipe.detect_pose
+            landmarks = None
+            while (item := frame_queue.get()) is not _END_OF_VIDEO:
+                actual_frame_number, frame = item
                 
                 # Detect pose
-                landmarks = self._mediapipe.detect_pose(frame)
+                if change_detector is None or not change_detector.unchanged(frame):
+                    landmarks = detect_pose(frame, actual_frame_number * 1000.0 / fps)
                 if landmarks is not None:
-                    confidence = sum(lm.visibility for lm in landmarks) / len(landmarks)
+                    points = landmarks_to_array(landmarks)
+                    confidence = pose_confidence(points)
                     
                     # Use the ACTUAL frame number from the video, not a sequential counter
                     result = PoseResult(
                         frame_id=actual_frame_number,  # This is the real frame number in the video
                         timestamp=actual_frame_number / fps,
-                        landmarks=landmarks,
+                        landmarks=points,
                         confidence=confidence,
-                        source_file=str(video_path)
+                        source_file=source_file
                     )
                     
-                    # Yield both result and the actual frame that was processed
-                    yield result, frame.copy()
-                
-                actual_frame_number += 1
+                    # Each decoded frame is a fresh array owned by the caller from here
+                    yield result, frame
+            
+            if errors:
+                raise errors[0]
                 
         except Exception as e:
             if isinstance(e, (FileProcessingError, DetectionError)):
                 raise
             raise DetectionError(f"Failed to process video {video_path}: {str(e)}")
         finally:
+            stop_event.set()
+            if decoder is not None:
+                decoder.join()
             if cap is not None:
                 cap.release()
     
+    @staticmethod
+    def _decode_frames(cap: cv2.VideoCapture,
+                       frame_queue: queue.Queue,
+                       stop_event: threading.Event,
+                       errors: List[BaseException],
+                       stride: int = 1) -> None:
+        """Decoder thread for detect_video: read frames into a bounded queue.
+        
+        Args:
+            cap: Opened video capture, read only by this thread while it runs
+            frame_queue: Queue receiving (frame_number, frame) tuples, then
+                _END_OF_VIDEO
+            stop_event: Set by the consumer to stop decoding early
+            errors: Collects a decode failure for the consumer to re-raise
+            stride: Only every Nth frame is retrieved as an image
+        """
+        try:
+            frame_number = 0
+            while not stop_event.is_set():
+                # grab() only advances the stream; retrieve() is what converts
+                # the decoded picture into a new BGR array
+                if frame_number % stride:
+                    if not cap.grab():
+                        break
+                    frame_number += 1
+                    continue
+                
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                while not stop_event.is_set():
+                    try:
+                        frame_queue.put((frame_number, frame), timeout=_DECODE_POLL_INTERVAL)
+                        break
+                    except queue.Full:
+                        continue
+                frame_number += 1
+        except Exception as e:
+            errors.append(FileProcessingError(f"Failed to read video frame: {str(e)}"))
+        finally:
+            # The consumer only stops early after setting stop_event, so the
+            # marker is needed (and can block) only while it is still reading
+            while not stop_event.is_set():
+                try:
+                    frame_queue.put(_END_OF_VIDEO, timeout=_DECODE_POLL_INTERVAL)
+                    break
+                except queue.Full:
+                    continue
+    
     def detect_batch_images(self, image_dir: Path) -> Iterator[PoseResult]:
         """Detect poses in a directory of images.
         
@@ -136,12 +379,13 @@ class PoseDetector:
         Yields:
             PoseResult for each image with detected pose
         """
-        supported_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp'}
-        
-        image_files = []
-        for ext in supported_extensions:
-            image_files.extend(image_dir.glob(f"*{ext}"))
-            image_files.extend(image_dir.glob(f"*{ext.upper()}"))
+        # One directory pass; is_file() uses the type cached by scandir
+        with os.scandir(image_dir) as entries:
+            image_files = [
+                Path(entry.path) for entry in entries
+                if entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in _BATCH_IMAGE_EXTENSIONS
+            ]
         
         image_files.sort()  # Process in alphabetical order
         
@@ -152,9 +396,49 @@ class PoseDetector:
             if result is not None:
                 yield result
     
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[Optional[np.ndarray]]:
+        """Detect poses in a batch of independent frames concurrently.
+        
+        Frames are spread over a thread pool where each worker owns its own
+        MediaPipe graph. MediaPipe releases the GIL during inference, so the
+        workers run on separate cores. Because each worker tracks only the
+        frames it sees, use this for unrelated images rather than
+        consecutive video frames.
+        
+        Args:
+            frames: Images as numpy arrays (BGR format)
+            
+        Returns:
+            Landmarks (or None if no pose detected) for each frame, in input order
+            
+        Raises:
+            DetectionError: If detection fails
+        """
+        if self._batch_pool is None:
+            self._batch_pool = ThreadPoolExecutor(
+                max_workers=self.num_workers,
+                thread_name_prefix="pipedetect-detect"
+            )
+        
+        return list(self._batch_pool.map(self._detect_in_worker, frames))
+    
+    def _detect_in_worker(self, frame: np.ndarray) -> Optional[np.ndarray]:
+        """Run detection with the calling worker thread's MediaPipe graph."""
+        wrapper = getattr(self._worker_local, "mediapipe", None)
+        if wrapper is None:
+            wrapper = MediaPipeWrapper(self.config)
+            self._worker_local.mediapipe = wrapper
+            with self._worker_lock:
+                self._worker_wrappers.append(wrapper)
+        
+        return wrapper.detect_pose(frame)
+    
     def get_frame_from_video(self, video_path: Path, frame_id: int) -> Optional[np.ndarray]:
         """Extract a specific frame from video.
         
+        The capture stays open for later calls on the same video until
+        release_videos or close is called.
+        
         Args:
             video_path: Path to video file
             frame_id: Frame number to extract
@@ -162,26 +446,47 @@ class PoseDetector:
         Returns:
             Frame as numpy array or None if frame not found
         """
-        cap = None
-        try:
-            cap = cv2.VideoCapture(str(video_path))
-            if not cap.isOpened():
+        key = str(video_path)
+        with self._capture_lock:
+            cap = self._capture_cache.get(key)
+            try:
+                if cap is None:
+                    try:
+                        cap = self.open_video(video_path)
+                    except FileProcessingError:
+                        return None
+                    self._capture_cache[key] = cap
+                
+                # Seeking re-decodes from the previous keyframe; skip it when
+                # frames are requested in order
+                if int(cap.get(cv2.CAP_PROP_POS_FRAMES)) != frame_id:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
+                ret, frame = cap.read()
+                
+                return frame if ret else None
+                
+            except Exception as e:
+                logger.warning(f"Failed to extract frame {frame_id} from {video_path}: {e}")
                 return None
-            
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
-            ret, frame = cap.read()
-            
-            return frame if ret else None
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract frame {frame_id} from {video_path}: {e}")
-            return None
-        finally:
-            if cap is not None:
+    
+    def release_videos(self) -> None:
+        """Release the captures cached by get_frame_from_video."""
+        with self._capture_lock:
+            for cap in self._capture_cache.values():
                 cap.release()
+            self._capture_cache.clear()
     
     def close(self) -> None:
         """Clean up resources."""
+        if self._batch_pool is not None:
+            self._batch_pool.shutdown(wait=True)
+            self._batch_pool = None
+        
+        for wrapper in self._worker_wrappers:
+            wrapper.close()
+        self._worker_wrappers.clear()
+        
+        self.release_videos()
         self._mediapipe.close()
         logger.info("PoseDetector closed")
     
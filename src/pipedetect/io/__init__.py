@@ -1,7 +1,7 @@
 """Input/Output handling for pose detection results."""
 
-from .exporters import JSONExporter, CSVExporter
+from .exporters import JSONExporter, CSVExporter, ResultStream
 from .validators import InputValidator
 from .file_manager import FileManager
 
-__all__ = ["JSONExporter", "CSVExporter", "InputValidator", "FileManager"] 
\ No newline at end of file
+__all__ = ["JSONExporter", "CSVExporter", "ResultStream", "InputValidator", "FileManager"]
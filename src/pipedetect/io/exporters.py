@@ -2,149 +2,333 @@
 
 import json
 import csv
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable
 from datetime import datetime
 
 from loguru import logger
 
-from ..core.models import PoseResult, ProcessingStats
+from ..core.models import LANDMARK_FIELDS, PoseResult, ProcessingStats
 from ..core.exceptions import OutputError
 
+try:
+    import orjson
+except ImportError:  # optional: pip install pipedetect[fast]
+    orjson = None
+
+
+# MediaPipe has 33 pose landmarks
+NUM_POSE_LANDMARKS = 33
+
+# CSV header: result metadata followed by one column per landmark field
+CSV_HEADER = ['frame_id', 'timestamp', 'confidence', 'source_file'] + [
+    f'landmark_{i}_{field}' for i in range(NUM_POSE_LANDMARKS) for field in LANDMARK_FIELDS
+]
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize an object as 2-space indented UTF-8 JSON.
+    
+    Uses orjson when it is installed, otherwise the standard library; both
+    produce the same layout.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _serialize_metadata(stats: ProcessingStats) -> Dict[str, Any]:
+    """Convert processing statistics to the export metadata block."""
+    return {
+        "export_timestamp": datetime.now().isoformat(),
+        "total_frames": stats.total_frames,
+        "processed_frames": stats.processed_frames,
+        "failed_frames": stats.failed_frames,
+        "success_rate": stats.success_rate,
+        "processing_time_seconds": stats.processing_time,
+        "fps": stats.fps,
+        "start_time": stats.start_time.isoformat(),
+        "end_time": stats.end_time.isoformat()
+    }
+
+
+def _serialize_result(result: PoseResult) -> Dict[str, Any]:
+    """Convert a pose result to its JSON dictionary form."""
+    return {
+        "frame_id": result.frame_id,
+        "timestamp": result.timestamp,
+        "confidence": result.confidence,
+        "source_file": result.source_file,
+        "landmarks": [
+            dict(zip(LANDMARK_FIELDS, landmark))
+            for landmark in result.landmarks.tolist()
+        ]
+    }
+
+
+class ResultStream(ABC):
+    """Incremental writer that receives pose results one at a time.
+    
+    Streams let long runs export results as they are produced instead of
+    holding them all in memory. Call finish() once all results are written,
+    or discard() to drop the partial output.
+    """
+    
+    def __init__(self, output_path: Path):
+        """Initialize result stream.
+        
+        Args:
+            output_path: Output file path
+        """
+        self.output_path = output_path
+        self.count = 0
+    
+    @abstractmethod
+    def write(self, result: PoseResult) -> None:
+        """Write a single result.
+        
+        Args:
+            result: Pose detection result
+        """
+        pass
+    
+    @abstractmethod
+    def finish(self, stats: ProcessingStats) -> None:
+        """Complete the output file.
+        
+        Args:
+            stats: Processing statistics
+        """
+        pass
+    
+    @abstractmethod
+    def discard(self) -> None:
+        """Abandon the stream and remove any partial output."""
+        pass
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; partial output is removed on error."""
+        if exc_type is not None:
+            self.discard()
+
 
 class BaseExporter(ABC):
     """Base class for result exporters."""
     
     @abstractmethod
-    def export(self, results: List[PoseResult], output_path: Path, stats: ProcessingStats) -> None:
+    def open_stream(self, output_path: Path) -> ResultStream:
+        """Open an incremental writer for the output file.
+        
+        Args:
+            output_path: Output file path
+            
+        Returns:
+            Result stream
+        """
+        pass
+    
+    def export(self, results: Iterable[PoseResult], output_path: Path, stats: ProcessingStats) -> None:
         """Export results to file.
         
+        Results are written one at a time, so a generator is consumed
+        lazily and never materialized.
+        
         Args:
-            results: List of pose detection results
+            results: Pose detection results, as a list or any iterable
             output_path: Output file path
             stats: Processing statistics
         """
-        pass
+        with self.open_stream(output_path) as stream:
+            for result in results:
+                stream.write(result)
+            stream.finish(stats)
 
 
-class JSONExporter(BaseExporter):
-    """Export results to JSON format."""
+class JSONResultStream(ResultStream):
+    """Streams results into a JSON document.
     
-    def export(self, results: List[PoseResult], output_path: Path, stats: ProcessingStats) -> None:
-        """Export results to JSON file.
+    The metadata block leads the document but depends on final statistics,
+    so results are spooled to a sibling ``.part`` file and copied in behind
+    the metadata on finish(). The output matches a single json.dump call.
+    """
+    
+    def __init__(self, output_path: Path):
+        """Initialize JSON result stream.
         
         Args:
-            results: List of pose detection results
             output_path: JSON output file path
-            stats: Processing statistics
         """
+        super().__init__(output_path)
+        self._spool_path = output_path.with_name(output_path.name + ".part")
+        
         try:
-            # Convert results to dictionary format
-            export_data = {
-                "metadata": {
-                    "export_timestamp": datetime.now().isoformat(),
-                    "total_frames": stats.total_frames,
-                    "processed_frames": stats.processed_frames,
-                    "failed_frames": stats.failed_frames,
-                    "success_rate": stats.success_rate,
-                    "processing_time_seconds": stats.processing_time,
-                    "fps": stats.fps,
-                    "start_time": stats.start_time.isoformat(),
-                    "end_time": stats.end_time.isoformat()
-                },
-                "results": []
-            }
-            
-            # Convert each result to dict
-            for result in results:
-                result_dict = {
-                    "frame_id": result.frame_id,
-                    "timestamp": result.timestamp,
-                    "confidence": result.confidence,
-                    "source_file": result.source_file,
-                    "landmarks": []
-                }
-                
-                # Convert landmarks
-                for landmark in result.landmarks:
-                    result_dict["landmarks"].append({
-                        "x": landmark.x,
-                        "y": landmark.y,
-                        "z": landmark.z,
-                        "visibility": landmark.visibility,
-                        "presence": landmark.presence
-                    })
-                
-                export_data["results"].append(result_dict)
-            
-            # Write to file
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            self._spool = open(self._spool_path, 'wb')
+        except Exception as e:
+            raise OutputError(f"Failed to export JSON to {output_path}: {str(e)}")
+    
+    def write(self, result: PoseResult) -> None:
+        """Write a single result to the spool file.
+        
+        Args:
+            result: Pose detection result
+        """
+        try:
+            if self.count:
+                self._spool.write(b",\n")
+            # Nest under "results"; JSON strings never contain raw newlines
+            text = _dumps_indented(_serialize_result(result))
+            self._spool.write(b"    " + text.replace(b"\n", b"\n    "))
+            self.count += 1
             
-            logger.info(f"Exported {len(results)} results to JSON: {output_path}")
+        except Exception as e:
+            raise OutputError(f"Failed to export JSON to {self.output_path}: {str(e)}")
+    
+    def finish(self, stats: ProcessingStats) -> None:
+        """Write the final JSON document.
+        
+        Args:
+            stats: Processing statistics
+        """
+        try:
+            self._spool.close()
+            
+            # Metadata object without the closing brace of the document
+            header = _dumps_indented({"metadata": _serialize_metadata(stats)})[:-2]
+            
+            with open(self.output_path, 'wb') as f:
+                f.write(header)
+                f.write(b',\n  "results": [')
+                if self.count:
+                    f.write(b"\n")
+                    with open(self._spool_path, 'rb') as spool:
+                        shutil.copyfileobj(spool, f)
+                    f.write(b"\n  ")
+                f.write(b"]\n}")
+            
+            self._spool_path.unlink()
+            
+            logger.info(f"Exported {self.count} results to JSON: {self.output_path}")
             
         except Exception as e:
-            raise OutputError(f"Failed to export JSON to {output_path}: {str(e)}")
+            raise OutputError(f"Failed to export JSON to {self.output_path}: {str(e)}")
+    
+    def discard(self) -> None:
+        """Remove the spool file."""
+        self._spool.close()
+        self._spool_path.unlink(missing_ok=True)
 
 
-class CSVExporter(BaseExporter):
-    """Export results to CSV format."""
+class CSVResultStream(ResultStream):
+    """Streams results into a CSV file, one row per result.
     
-    def export(self, results: List[PoseResult], output_path: Path, stats: ProcessingStats) -> None:
-        """Export results to CSV file.
+    The file is created with the first result, so no file is written when
+    there are no results.
+    """
+    
+    def __init__(self, output_path: Path):
+        """Initialize CSV result stream.
         
         Args:
-            results: List of pose detection results
             output_path: CSV output file path
+        """
+        super().__init__(output_path)
+        self._file = None
+        self._writer = None
+    
+    def write(self, result: PoseResult) -> None:
+        """Write a single result row.
+        
+        Args:
+            result: Pose detection result
+        """
+        try:
+            if self._writer is None:
+                self._open()
+            
+            row = [
+                result.frame_id,
+                result.timestamp,
+                result.confidence,
+                result.source_file
+            ]
+            
+            # Add landmark data (pad with zeros if less than 33 landmarks)
+            landmarks = result.landmarks[:NUM_POSE_LANDMARKS]
+            row.extend(landmarks.ravel().tolist())
+            row.extend([0.0] * (NUM_POSE_LANDMARKS - len(landmarks)) * len(LANDMARK_FIELDS))
+            
+            self._writer.writerow(row)
+            self.count += 1
+            
+        except Exception as e:
+            raise OutputError(f"Failed to export CSV to {self.output_path}: {str(e)}")
+    
+    def _open(self) -> None:
+        """Create the CSV file and write the header."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.output_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_HEADER)
+    
+    def finish(self, stats: ProcessingStats) -> None:
+        """Close the CSV file.
+        
+        Args:
             stats: Processing statistics
         """
-        if not results:
+        if self._file is None:
             logger.warning("No results to export to CSV")
             return
-            
+        
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                # Write header
-                header = ['frame_id', 'timestamp', 'confidence', 'source_file']
-                
-                # Add landmark columns (MediaPipe has 33 pose landmarks)
-                for i in range(33):
-                    header.extend([
-                        f'landmark_{i}_x', f'landmark_{i}_y', f'landmark_{i}_z',
-                        f'landmark_{i}_visibility', f'landmark_{i}_presence'
-                    ])
-                
-                writer.writerow(header)
-                
-                # Write results
-                for result in results:
-                    row = [
-                        result.frame_id,
-                        result.timestamp,
-                        result.confidence,
-                        result.source_file
-                    ]
-                    
-                    # Add landmark data (pad with zeros if less than 33 landmarks)
-                    for i in range(33):
-                        if i < len(result.landmarks):
-                            lm = result.landmarks[i]
-                            row.extend([lm.x, lm.y, lm.z, lm.visibility, lm.presence])
-                        else:
-                            row.extend([0.0, 0.0, 0.0, 0.0, 0.0])
-                    
-                    writer.writerow(row)
-            
-            logger.info(f"Exported {len(results)} results to CSV: {output_path}")
+            self._file.close()
+            logger.info(f"Exported {self.count} results to CSV: {self.output_path}")
             
         except Exception as e:
-            raise OutputError(f"Failed to export CSV to {output_path}: {str(e)}")
+            raise OutputError(f"Failed to export CSV to {self.output_path}: {str(e)}")
+    
+    def discard(self) -> None:
+        """Remove the partially written CSV file."""
+        if self._file is not None:
+            self._file.close()
+            self.output_path.unlink(missing_ok=True)
+
+
+class JSONExporter(BaseExporter):
+    """Export results to JSON format."""
+    
+    def open_stream(self, output_path: Path) -> JSONResultStream:
+        """Open an incremental JSON writer.
+        
+        Args:
+            output_path: JSON output file path
+            
+        Returns:
+            JSON result stream
+        """
+        return JSONResultStream(output_path)
+
+
+class CSVExporter(BaseExporter):
+    """Export results to CSV format."""
+    
+    def open_stream(self, output_path: Path) -> CSVResultStream:
+        """Open an incremental CSV writer.
+        
+        Args:
+            output_path: CSV output file path
+            
+        Returns:
+            CSV result stream
+        """
+        return CSVResultStream(output_path)
 
 
 class ExporterFactory:
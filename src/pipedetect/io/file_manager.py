@@ -2,7 +2,8 @@
 
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import List, Union
+import os
 import shutil
 
 import cv2
@@ -12,6 +13,9 @@ from loguru import logger
 from ..core.models import OutputPaths
 from ..core.exceptions import OutputError, FileProcessingError
 
+# JPEG quality for saved frames; trades a little fidelity for faster encodes
+DEFAULT_JPEG_QUALITY = 90
+
 
 class FileManager:
     """Manages file operations for pose detection outputs."""
@@ -67,13 +71,84 @@ class FileManager:
         return paths
     
     @staticmethod
-    def save_frame(frame: np.ndarray, output_path: Path, frame_id: int) -> None:
+    def write_jpeg(image: np.ndarray, path: Union[str, Path], quality: int = DEFAULT_JPEG_QUALITY) -> bool:
+        """Encode image as JPEG and write the bytes to path.
+        
+        Args:
+            image: Image data as numpy array (BGR format)
+            path: Output file path
+            quality: JPEG quality (0-100)
+            
+        Returns:
+            True if the image was encoded and written
+        """
+        success, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not success:
+            return False
+        
+        buffer.tofile(str(path))
+        return True
+    
+    @staticmethod
+    def frame_path_template(output_path: Path, prefix: str) -> str:
+        """Build a %-style path template for numbered frame files.
+        
+        Formatting the template with a frame number is much cheaper than
+        joining Path objects for every frame in a processing loop.
+        
+        Args:
+            output_path: Output directory path
+            prefix: File name prefix, e.g. "frame" or "overlay"
+            
+        Returns:
+            Template such as "<output_path>/frame_%06d.jpg"
+        """
+        return os.path.join(str(output_path), f"{prefix}_%06d.jpg")
+    
+    @staticmethod
+    def save_frame_path(
+        frame: np.ndarray,
+        frame_path: str,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY
+    ) -> None:
+        """Save frame to a prebuilt file path.
+        
+        Unlike save_frame, the parent directory must already exist.
+        
+        Args:
+            frame: Frame data as numpy array
+            frame_path: Output file path, usually from frame_path_template
+            jpeg_quality: JPEG quality (0-100)
+            
+        Raises:
+            OutputError: If frame cannot be saved
+        """
+        try:
+            success = FileManager.write_jpeg(frame, frame_path, jpeg_quality)
+            if not success:
+                raise OutputError(f"Failed to save frame {frame_path}")
+            
+            logger.debug("Saved frame {}", frame_path)
+            
+        except Exception as e:
+            if isinstance(e, OutputError):
+                raise
+            raise OutputError(f"Error saving frame {frame_path}: {str(e)}")
+    
+    @staticmethod
+    def save_frame(
+        frame: np.ndarray,
+        output_path: Path,
+        frame_id: int,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY
+    ) -> None:
         """Save video frame to file.
         
         Args:
             frame: Frame data as numpy array
             output_path: Output directory path
             frame_id: Frame identifier
+            jpeg_quality: JPEG quality (0-100)
             
         Raises:
             OutputError: If frame cannot be saved
@@ -86,11 +161,11 @@ class FileManager:
             frame_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Save frame
-            success = cv2.imwrite(str(frame_path), frame)
+            success = FileManager.write_jpeg(frame, frame_path, jpeg_quality)
             if not success:
                 raise OutputError(f"Failed to save frame {frame_id}")
             
-            logger.debug(f"Saved frame {frame_id} to {frame_path}")
+            logger.debug("Saved frame {} to {}", frame_id, frame_path)
             
         except Exception as e:
             if isinstance(e, OutputError):
@@ -101,7 +176,8 @@ class FileManager:
     def save_overlay_frame(
         overlay_frame: np.ndarray, 
         output_path: Path, 
-        frame_id: int
+        frame_id: int,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY
     ) -> None:
         """Save overlay frame to file.
         
@@ -109,6 +185,7 @@ class FileManager:
             overlay_frame: Frame with pose overlay
             output_path: Output directory path
             frame_id: Frame identifier
+            jpeg_quality: JPEG quality (0-100)
             
         Raises:
             OutputError: If overlay frame cannot be saved
@@ -121,11 +198,11 @@ class FileManager:
             overlay_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Save overlay frame
-            success = cv2.imwrite(str(overlay_path), overlay_frame)
+            success = FileManager.write_jpeg(overlay_frame, overlay_path, jpeg_quality)
             if not success:
                 raise OutputError(f"Failed to save overlay frame {frame_id}")
             
-            logger.debug(f"Saved overlay frame {frame_id} to {overlay_path}")
+            logger.debug("Saved overlay frame {} to {}", frame_id, overlay_path)
             
         except Exception as e:
             if isinstance(e, OutputError):
@@ -154,7 +231,7 @@ class FileManager:
             # Copy file
             shutil.copy2(source_path, frame_path)
             
-            logger.debug(f"Copied image {source_path} to {frame_path}")
+            logger.debug("Copied image {} to {}", source_path, frame_path)
             
         except Exception as e:
             raise FileProcessingError(f"Error copying image {source_path}: {str(e)}")
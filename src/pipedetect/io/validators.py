@@ -3,22 +3,56 @@
 from pathlib import Path
 from typing import List, Union
 import mimetypes
+import os
+import stat
 
 from loguru import logger
 
 from ..core.exceptions import ValidationError
 
 
+_IMAGE_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'
+})
+
+_VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'
+})
+
+
+# Tuple forms for str.endswith(), which matches them in one C call
+_IMAGE_SUFFIXES = tuple(sorted(_IMAGE_EXTENSIONS))
+_VIDEO_SUFFIXES = tuple(sorted(_VIDEO_EXTENSIONS))
+
+
+def _has_suffix(name: str, suffixes: tuple) -> bool:
+    """Check a file name against extensions without splitting the name.
+    
+    Accepts the same names as looking up the lowercased os.path.splitext()
+    extension in the set: the extension must follow a non-dot character, so
+    names like ".jpg" have none.
+    """
+    if not name.lower().endswith(suffixes):
+        return False
+    return name[0] != '.' or name[:name.rindex('.')].lstrip('.') != ''
+
+
+def _has_image_ext(name: str) -> bool:
+    """Check a file name's extension only, without touching the filesystem."""
+    return _has_suffix(name, _IMAGE_SUFFIXES)
+
+
+def _has_video_ext(name: str) -> bool:
+    """Check a file name's extension only, without touching the filesystem."""
+    return _has_suffix(name, _VIDEO_SUFFIXES)
+
+
 class InputValidator:
     """Validates input files and directories."""
     
-    SUPPORTED_IMAGE_EXTENSIONS = {
-        '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'
-    }
+    SUPPORTED_IMAGE_EXTENSIONS = _IMAGE_EXTENSIONS
     
-    SUPPORTED_VIDEO_EXTENSIONS = {
-        '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'
-    }
+    SUPPORTED_VIDEO_EXTENSIONS = _VIDEO_EXTENSIONS
     
     @classmethod
     def validate_input_path(cls, input_path: Union[str, Path]) -> Path:
@@ -80,10 +114,8 @@ class InputValidator:
         Returns:
             True if file is a supported image
         """
-        if not file_path.is_file():
-            return False
-        
-        return file_path.suffix.lower() in cls.SUPPORTED_IMAGE_EXTENSIONS
+        # The extension test is free; only stat paths that could qualify
+        return _has_image_ext(file_path.name) and file_path.is_file()
     
     @classmethod
     def is_video_file(cls, file_path: Path) -> bool:
@@ -95,10 +127,7 @@ class InputValidator:
         Returns:
             True if file is a supported video
         """
-        if not file_path.is_file():
-            return False
-        
-        return file_path.suffix.lower() in cls.SUPPORTED_VIDEO_EXTENSIONS
+        return _has_video_ext(file_path.name) and file_path.is_file()
     
     @classmethod
     def get_input_type(cls, input_path: Path) -> str:
@@ -113,15 +142,22 @@ class InputValidator:
         Raises:
             ValidationError: If input type cannot be determined
         """
-        if input_path.is_file():
-            if cls.is_image_file(input_path):
+        # One stat serves both the file and directory checks
+        try:
+            mode = os.stat(input_path).st_mode
+        except (OSError, ValueError):
+            raise ValidationError(f"Input is neither file nor directory: {input_path}")
+        
+        if stat.S_ISREG(mode):
+            # Already known to be a file, so only the extension is left to check
+            if _has_image_ext(input_path.name):
                 return 'image'
-            elif cls.is_video_file(input_path):
+            elif _has_video_ext(input_path.name):
                 return 'video'
             else:
                 raise ValidationError(f"Unsupported file format: {input_path}")
         
-        elif input_path.is_dir():
+        elif stat.S_ISDIR(mode):
             return 'directory'
         
         else:
@@ -143,16 +179,22 @@ class InputValidator:
         if not dir_path.is_dir():
             raise ValidationError(f"Not a directory: {dir_path}")
         
-        image_files = []
-        for file_path in dir_path.iterdir():
-            if cls.is_image_file(file_path):
-                image_files.append(file_path)
+        # scandir caches each entry's type, so regular files need no extra stat
+        with os.scandir(dir_path) as entries:
+            image_paths = [
+                entry.path for entry in entries
+                if _has_image_ext(entry.name) and entry.is_file()
+            ]
         
-        if not image_files:
+        if not image_paths:
             raise ValidationError(f"No supported image files found in: {dir_path}")
         
-        logger.info(f"Found {len(image_files)} image files in {dir_path}")
-        return sorted(image_files)
+        # Entries share the directory prefix, so sorting the strings gives
+        # the same order as sorting Paths without their slower comparisons
+        image_paths.sort()
+        
+        logger.info(f"Found {len(image_paths)} image files in {dir_path}")
+        return [Path(path) for path in image_paths]
     
     @classmethod
     def validate_confidence_threshold(cls, confidence: float) -> float:
@@ -11,7 +11,8 @@ def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[Path] = None,
     enable_console: bool = True,
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    debug_tracebacks: bool = False
 ) -> None:
     """Setup logging configuration using loguru.
     
@@ -20,6 +21,9 @@ def setup_logging(
         log_file: Optional log file path
         enable_console: Whether to enable console logging
         format_string: Custom format string (optional)
+        debug_tracebacks: Whether to log extended tracebacks with the values
+            of local variables. Slow, and the values may include sensitive
+            data, so keep it off outside of debugging.
     """
     # Remove default logger
     logger.remove()
@@ -40,8 +44,8 @@ def setup_logging(
             format=format_string,
             level=log_level.upper(),
             colorize=True,
-            backtrace=True,
-            diagnose=True
+            backtrace=debug_tracebacks,
+            diagnose=debug_tracebacks
         )
     
     # Add file handler if specified
@@ -54,8 +58,8 @@ def setup_logging(
             rotation="10 MB",
             retention="1 week",
             compression="zip",
-            backtrace=True,
-            diagnose=True
+            backtrace=debug_tracebacks,
+            diagnose=debug_tracebacks
         )
         logger.info(f"Logging to file: {log_file}")
     
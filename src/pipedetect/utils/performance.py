@@ -1,8 +1,8 @@
 """Performance profiling utilities."""
 
+import os
 import time
 import psutil
-import threading
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 from contextlib import contextmanager
@@ -10,7 +10,11 @@ from contextlib import contextmanager
 from loguru import logger
 
 
-@dataclass
+# Minimum seconds between system resource samples
+_SAMPLE_INTERVAL = 0.5
+
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Container for performance metrics."""
     cpu_percent: float = 0.0
@@ -33,7 +37,12 @@ class PerformanceMetrics:
 
 
 class PerformanceProfiler:
-    """Profiles performance during pose detection."""
+    """Profiles performance during pose detection.
+    
+    System resources are sampled from the processing thread itself: at
+    start, on frame count updates at most once per sample interval, and at
+    stop. No monitoring thread competes with detection for the GIL.
+    """
     
     def __init__(self, enable_monitoring: bool = True):
         """Initialize performance profiler.
@@ -44,22 +53,36 @@ class PerformanceProfiler:
         self.enable_monitoring = enable_monitoring
         self.metrics = PerformanceMetrics()
         self._start_time: Optional[float] = None
-        self._monitoring_thread: Optional[threading.Thread] = None
-        self._stop_monitoring = threading.Event()
-        self._cpu_samples = []
-        self._memory_samples = []
+        self._process: Optional[psutil.Process] = None
+        self._total_memory = 0
+        
+        # perf_counter() time of the next due sample; infinite while not monitoring
+        self._next_sample_time = float('inf')
+        self._last_cpu_time: Optional[float] = None
+        self._last_sample_time = 0.0
+        
+        # Running sums of the resource samples, so long runs use constant memory
+        self._cpu_count = 0
+        self._cpu_sum = 0.0
+        self._memory_count = 0
+        self._memory_percent_sum = 0.0
+        self._memory_mb_sum = 0.0
+        self._last_cpu = 0.0
+        self._last_memory_mb = 0.0
         
     def start(self) -> None:
         """Start performance monitoring."""
-        self._start_time = time.time()
-        self._stop_monitoring.clear()
+        self._start_time = time.perf_counter()
         
         if self.enable_monitoring:
-            self._monitoring_thread = threading.Thread(
-                target=self._monitor_system_resources,
-                daemon=True
-            )
-            self._monitoring_thread.start()
+            try:
+                self._process = psutil.Process()
+                self._total_memory = psutil.virtual_memory().total
+            except Exception as e:
+                logger.warning(f"Error monitoring system resources: {e}")
+            else:
+                self._last_cpu_time = None
+                self._sample_system_resources()
             
         logger.debug("Performance monitoring started")
     
@@ -69,22 +92,21 @@ class PerformanceProfiler:
         Returns:
             Performance metrics
         """
-        if self._start_time:
-            self.metrics.processing_time = time.time() - self._start_time
+        if self._start_time is not None:
+            self.metrics.processing_time = time.perf_counter() - self._start_time
         
         if self.enable_monitoring:
-            self._stop_monitoring.set()
-            
-            if self._monitoring_thread and self._monitoring_thread.is_alive():
-                self._monitoring_thread.join(timeout=1.0)
+            if self._next_sample_time != float('inf'):
+                self._sample_system_resources()
+                self._next_sample_time = float('inf')
             
             # Calculate averages
-            if self._cpu_samples:
-                self.metrics.cpu_percent = sum(self._cpu_samples) / len(self._cpu_samples)
+            if self._cpu_count:
+                self.metrics.cpu_percent = self._cpu_sum / self._cpu_count
             
-            if self._memory_samples:
-                self.metrics.memory_percent = sum(s[0] for s in self._memory_samples) / len(self._memory_samples)
-                self.metrics.memory_mb = sum(s[1] for s in self._memory_samples) / len(self._memory_samples)
+            if self._memory_count:
+                self.metrics.memory_percent = self._memory_percent_sum / self._memory_count
+                self.metrics.memory_mb = self._memory_mb_sum / self._memory_count
         
         # Calculate FPS
         if self.metrics.processing_time > 0:
@@ -102,33 +124,45 @@ class PerformanceProfiler:
             frames_processed: Total frames processed so far
         """
         self.metrics.frames_processed = frames_processed
+        if time.perf_counter() >= self._next_sample_time:
+            self._sample_system_resources()
     
     def increment_frame_count(self) -> None:
         """Increment frame count by 1."""
         self.metrics.frames_processed += 1
+        if time.perf_counter() >= self._next_sample_time:
+            self._sample_system_resources()
     
-    def _monitor_system_resources(self) -> None:
-        """Monitor system resources in background thread."""
-        process = psutil.Process()
+    def _sample_system_resources(self) -> None:
+        """Record one CPU and memory sample.
         
-        while not self._stop_monitoring.is_set():
-            try:
-                # CPU usage
-                cpu_percent = process.cpu_percent()
-                self._cpu_samples.append(cpu_percent)
-                
-                # Memory usage
-                memory_info = process.memory_info()
-                memory_percent = process.memory_percent()
-                memory_mb = memory_info.rss / (1024 * 1024)
-                self._memory_samples.append((memory_percent, memory_mb))
-                
-                # Sample every 0.5 seconds
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.warning(f"Error monitoring system resources: {e}")
-                break
+        CPU usage is derived from the process CPU time reported by os.times()
+        since the previous sample, which needs no /proc parsing; memory needs
+        one memory_info() read per sample.
+        """
+        try:
+            # CPU usage since the previous sample
+            times = os.times()
+            cpu_time = times.user + times.system
+            now = time.perf_counter()
+            if self._last_cpu_time is not None and now > self._last_sample_time:
+                self._last_cpu = 100.0 * (cpu_time - self._last_cpu_time) / (now - self._last_sample_time)
+                self._cpu_sum += self._last_cpu
+                self._cpu_count += 1
+            self._last_cpu_time, self._last_sample_time = cpu_time, now
+            
+            # Memory usage
+            rss = self._process.memory_info().rss
+            self._last_memory_mb = rss / (1024 * 1024)
+            self._memory_percent_sum += 100.0 * rss / self._total_memory
+            self._memory_mb_sum += self._last_memory_mb
+            self._memory_count += 1
+            
+            self._next_sample_time = now + _SAMPLE_INTERVAL
+            
+        except Exception as e:
+            logger.warning(f"Error monitoring system resources: {e}")
+            self._next_sample_time = float('inf')
     
     @contextmanager
     def profile_operation(self, operation_name: str):
@@ -137,13 +171,13 @@ class PerformanceProfiler:
         Args:
             operation_name: Name of the operation being profiled
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.debug(f"Starting operation: {operation_name}")
         
         try:
             yield
         finally:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.debug(f"Operation '{operation_name}' completed in {elapsed:.3f}s")
     
     def get_current_metrics(self) -> Dict[str, Any]:
@@ -152,8 +186,8 @@ class PerformanceProfiler:
         Returns:
             Dictionary with current metrics
         """
-        current_time = time.time()
-        if self._start_time:
+        current_time = time.perf_counter()
+        if self._start_time is not None:
             elapsed = current_time - self._start_time
             current_fps = self.metrics.frames_processed / elapsed if elapsed > 0 else 0
         else:
@@ -164,8 +198,8 @@ class PerformanceProfiler:
             'elapsed_time': elapsed,
             'frames_processed': self.metrics.frames_processed,
             'current_fps': current_fps,
-            'cpu_percent': self._cpu_samples[-1] if self._cpu_samples else 0,
-            'memory_mb': self._memory_samples[-1][1] if self._memory_samples else 0
+            'cpu_percent': self._last_cpu,
+            'memory_mb': self._last_memory_mb
         }
     
     def __enter__(self):
@@ -1,6 +1,6 @@
 """Visualization utilities for pose detection."""
 
-from .overlay_renderer import OverlayRenderer
+from .overlay_renderer import OverlayRenderer, POSE_CONNECTIONS
 from .progress_tracker import ProgressTracker
 
-__all__ = ["OverlayRenderer", "ProgressTracker"] 
\ No newline at end of file
+__all__ = ["OverlayRenderer", "ProgressTracker", "POSE_CONNECTIONS"] 
\ No newline at end of file
@@ -1,31 +1,38 @@
 """Pose overlay rendering utilities."""
 
-from typing import List, Tuple, Optional
+from typing import Final, Sequence, Tuple, Optional, Union
 import cv2
 import numpy as np
 from loguru import logger
 
-from ..core.models import LandmarkPoint, PoseResult
+from ..core.models import LandmarkPoint, PoseResult, landmarks_to_array
 from ..detection.mediapipe_wrapper import MediaPipeWrapper
 
 
+# MediaPipe pose landmark connections as a read-only (E, 2) index array
+POSE_CONNECTIONS: Final[np.ndarray] = np.array([
+    # Face
+    (0, 1), (1, 2), (2, 3), (3, 7),
+    (0, 4), (4, 5), (5, 6), (6, 8),
+    (9, 10),
+    # Body
+    (11, 12), (11, 13), (13, 15), (15, 17), (15, 19), (15, 21), (17, 19),
+    (12, 14), (14, 16), (16, 18), (16, 20), (16, 22), (18, 20),
+    (11, 23), (12, 24), (23, 24),
+    # Legs
+    (23, 25), (25, 27), (27, 29), (27, 31), (29, 31),
+    (24, 26), (26, 28), (28, 30), (28, 32), (30, 32)
+], dtype=np.int32)
+POSE_CONNECTIONS.setflags(write=False)
+
+# Landmark count every connection endpoint fits within
+_CONNECTED_LANDMARK_COUNT: Final[int] = int(POSE_CONNECTIONS.max()) + 1
+
+
 class OverlayRenderer:
     """Renders pose overlays on images and video frames."""
     
-    # MediaPipe pose landmark connections
-    POSE_CONNECTIONS = [
-        # Face
-        (0, 1), (1, 2), (2, 3), (3, 7),
-        (0, 4), (4, 5), (5, 6), (6, 8),
-        (9, 10),
-        # Body
-        (11, 12), (11, 13), (13, 15), (15, 17), (15, 19), (15, 21), (17, 19),
-        (12, 14), (14, 16), (16, 18), (16, 20), (16, 22), (18, 20),
-        (11, 23), (12, 24), (23, 24),
-        # Legs
-        (23, 25), (25, 27), (27, 29), (27, 31), (29, 31),
-        (24, 26), (26, 28), (28, 30), (28, 32), (30, 32)
-    ]
+    POSE_CONNECTIONS = POSE_CONNECTIONS
     
     def __init__(self, 
                  landmark_color: Tuple[int, int, int] = (0, 255, 0),
@@ -47,92 +54,92 @@ class OverlayRenderer:
     
     def render_pose_overlay(self, 
                           image: np.ndarray, 
-                          landmarks: List[LandmarkPoint],
+                          landmarks: Union[np.ndarray, Sequence[LandmarkPoint]],
                           draw_landmarks: bool = True,
                           draw_connections: bool = True,
-                          min_visibility: float = 0.5) -> np.ndarray:
+                          min_visibility: float = 0.5,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
         """Render pose overlay on image.
         
         Args:
             image: Input image
-            landmarks: Pose landmarks
+            landmarks: Pose landmarks, as points or an (N, 5) landmark array
             draw_landmarks: Whether to draw landmark points
             draw_connections: Whether to draw connections
             min_visibility: Minimum visibility threshold for drawing
+            out: Array to draw into instead of a new copy of the image. It
+                must match the image's shape and dtype; passing the image
+                itself draws in place.
             
         Returns:
             Image with pose overlay
         """
-        if not landmarks:
-            return image.copy()
+        overlay_image = self._output_buffer(image, out)
+        if not (draw_landmarks or draw_connections):
+            return overlay_image
+        
+        points = landmarks_to_array(landmarks)
+        if not len(points):
+            return overlay_image
         
-        overlay_image = image.copy()
         height, width = image.shape[:2]
         
-        # Convert normalized coordinates to pixel coordinates
-        pixel_landmarks = []
-        for lm in landmarks:
-            if lm.visibility >= min_visibility:
-                x = int(lm.x * width)
-                y = int(lm.y * height)
-                pixel_landmarks.append((x, y, lm.visibility))
-            else:
-                pixel_landmarks.append(None)
+        # Convert normalized coordinates to pixel coordinates in one pass
+        pixels = (points[:, :2] * (width, height)).astype(np.int32)
+        visibility = points[:, 3]
+        visible = visibility >= min_visibility
         
-        # Draw connections
+        # Draw all visible connections with a single polylines call
         if draw_connections:
-            for connection in self.POSE_CONNECTIONS:
-                start_idx, end_idx = connection
-                if (start_idx < len(pixel_landmarks) and 
-                    end_idx < len(pixel_landmarks) and
-                    pixel_landmarks[start_idx] is not None and
-                    pixel_landmarks[end_idx] is not None):
-                    
-                    start_point = pixel_landmarks[start_idx][:2]
-                    end_point = pixel_landmarks[end_idx][:2]
-                    
-                    cv2.line(overlay_image, start_point, end_point, 
-                            self.connection_color, self.connection_thickness)
+            connections = self.POSE_CONNECTIONS
+            if len(pixels) < _CONNECTED_LANDMARK_COUNT:
+                # Partial landmark sets only; a full pose covers every endpoint
+                connections = connections[(connections < len(pixels)).all(axis=1)]
+            connections = connections[visible[connections[:, 0]] & visible[connections[:, 1]]]
+            
+            if len(connections):
+                cv2.polylines(overlay_image, pixels[connections], False,
+                              self.connection_color, self.connection_thickness)
         
         # Draw landmarks
         if draw_landmarks:
-            for i, pixel_lm in enumerate(pixel_landmarks):
-                if pixel_lm is not None:
-                    x, y, visibility = pixel_lm
-                    # Adjust color intensity based on visibility
-                    color_intensity = int(255 * visibility)
-                    adjusted_color = (
-                        min(self.landmark_color[0], color_intensity),
-                        min(self.landmark_color[1], color_intensity),
-                        min(self.landmark_color[2], color_intensity)
-                    )
-                    
-                    cv2.circle(overlay_image, (x, y), self.landmark_size, 
-                              adjusted_color, -1)
-                    
-                    # Optionally draw landmark index
-                    if self.landmark_size > 3:
-                        cv2.putText(overlay_image, str(i), (x + 5, y - 5),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.3, 
-                                   (255, 255, 255), 1)
+            indices = np.flatnonzero(visible)
+            
+            # Adjust color intensity based on visibility, for all landmarks at once
+            color_intensity = (255 * visibility[indices]).astype(np.int64)
+            adjusted_colors = np.minimum(self.landmark_color, color_intensity[:, None])
+            
+            for i, (x, y), adjusted_color in zip(
+                indices.tolist(), pixels[indices].tolist(), adjusted_colors.tolist()
+            ):
+                cv2.circle(overlay_image, (x, y), self.landmark_size, 
+                          adjusted_color, -1)
+                
+                # Optionally draw landmark index
+                if self.landmark_size > 3:
+                    cv2.putText(overlay_image, str(i), (x + 5, y - 5),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.3, 
+                               (255, 255, 255), 1)
         
         return overlay_image
     
     def render_pose_with_confidence(self, 
                                   image: np.ndarray,
                                   pose_result: PoseResult,
-                                  show_confidence: bool = True) -> np.ndarray:
+                                  show_confidence: bool = True,
+                                  out: Optional[np.ndarray] = None) -> np.ndarray:
         """Render pose with confidence information.
         
         Args:
             image: Input image
             pose_result: Pose detection result
             show_confidence: Whether to display confidence text
+            out: Array to draw into instead of a new copy of the image
             
         Returns:
             Image with pose overlay and confidence info
         """
-        overlay_image = self.render_pose_overlay(image, pose_result.landmarks)
+        overlay_image = self.render_pose_overlay(image, pose_result.landmarks, out=out)
         
         if show_confidence:
             # Add confidence text
@@ -153,6 +160,15 @@ class OverlayRenderer:
         
         return overlay_image
     
+    @staticmethod
+    def _output_buffer(image: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Return the array to draw on, holding a copy of the image."""
+        if out is None:
+            return image.copy()
+        if out is not image:
+            np.copyto(out, image)
+        return out
+    
     def create_pose_comparison(self, 
                              original: np.ndarray,
                              overlay: np.ndarray) -> np.ndarray:
@@ -165,24 +181,25 @@ class OverlayRenderer:
         Returns:
             Combined comparison image
         """
-        # Ensure both images have the same height
-        if original.shape[0] != overlay.shape[0]:
-            target_height = min(original.shape[0], overlay.shape[0])
-            original = cv2.resize(original, 
-                                (int(original.shape[1] * target_height / original.shape[0]), 
-                                 target_height))
-            overlay = cv2.resize(overlay,
-                               (int(overlay.shape[1] * target_height / overlay.shape[0]),
-                                target_height))
-        
-        # Combine horizontally
-        comparison = np.hstack((original, overlay))
+        # Scale both images to the shorter height, straight into one output
+        target_height = min(original.shape[0], overlay.shape[0])
+        original_width = int(original.shape[1] * target_height / original.shape[0])
+        overlay_width = int(overlay.shape[1] * target_height / overlay.shape[0])
+        
+        comparison = np.empty((target_height, original_width + overlay_width) + original.shape[2:],
+                              dtype=original.dtype)
+        for image, region in ((original, comparison[:, :original_width]),
+                              (overlay, comparison[:, original_width:])):
+            if image.shape[:2] == region.shape[:2]:
+                region[...] = image
+            else:
+                cv2.resize(image, region.shape[1::-1], dst=region)
         
         # Add labels
         cv2.putText(comparison, "Original", (10, 30),
                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
         
-        overlay_x = original.shape[1] + 10
+        overlay_x = original_width + 10
         cv2.putText(comparison, "Pose Detection", (overlay_x, 30),
                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
         
@@ -4,7 +4,7 @@ import time
 from typing import Optional
 import sys
 
-from rich.progress import Progress, TaskID, BarColumn, TextColumn, TimeRemainingColumn
+from rich.progress import Progress, Task, TaskID, BarColumn, TextColumn, TimeRemainingColumn
 from rich.console import Console
 from loguru import logger
 
@@ -21,6 +21,7 @@ class ProgressTracker:
         self.console = console or Console()
         self.progress: Optional[Progress] = None
         self.task_id: Optional[TaskID] = None
+        self._task: Optional[Task] = None
         self.start_time: Optional[float] = None
         
     def start(self, total: int, description: str = "Processing") -> None:
@@ -43,7 +44,8 @@ class ProgressTracker:
         
         self.progress.start()
         self.task_id = self.progress.add_task(description, total=total)
-        self.start_time = time.time()
+        self._task = self.progress.tasks[-1]
+        self.start_time = time.perf_counter()
         
         logger.info(f"Started processing {total} items")
     
@@ -57,7 +59,8 @@ class ProgressTracker:
         if self.progress and self.task_id is not None:
             if description:
                 self.progress.update(self.task_id, description=description)
-            self.progress.update(self.task_id, advance=advance)
+            # advance() skips update()'s keyword handling; Rich redraws on its own timer
+            self.progress.advance(self.task_id, advance)
     
     def set_status(self, status: str) -> None:
         """Set current status message.
@@ -76,13 +79,14 @@ class ProgressTracker:
         """
         processing_time = 0.0
         
-        if self.start_time:
-            processing_time = time.time() - self.start_time
+        if self.start_time is not None:
+            processing_time = time.perf_counter() - self.start_time
         
         if self.progress:
             self.progress.stop()
             self.progress = None
             self.task_id = None
+            self._task = None
         
         logger.info(f"Processing completed in {processing_time:.2f} seconds")
         return processing_time
@@ -104,8 +108,8 @@ class ProgressTracker:
         if not self.is_active():
             return {}
         
-        task = self.progress.tasks[self.task_id]
-        elapsed_time = time.time() - self.start_time if self.start_time else 0
+        task = self._task
+        elapsed_time = time.perf_counter() - self.start_time if self.start_time is not None else 0
         
         return {
             'completed': task.completed,
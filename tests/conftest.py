@@ -0,0 +1,45 @@
+"""Shared test fixtures."""
+
+import threading
+
+import numpy as np
+import pytest
+
+
+class FakeMediaPipeWrapper:
+    """Stand-in for MediaPipeWrapper that reports a pose for bright frames."""
+    
+    instances = []
+    
+    def __init__(self, config):
+        self.config = config
+        self.threads = set()
+        self.timestamps = []
+        self.closed = False
+        self.calls = 0
+        FakeMediaPipeWrapper.instances.append(self)
+    
+    def detect_pose(self, image, timestamp_ms=None):
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        self.timestamps.append(timestamp_ms)
+        value = float(image.mean()) / 255.0
+        if value < 0.5:
+            return None
+        return np.tile([value, value, 0.0, value, 1.0], (33, 1))
+    
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_mediapipe(monkeypatch):
+    """Build pose detectors on FakeMediaPipeWrapper instead of MediaPipe.
+    
+    Returns:
+        The fake wrapper class; its ``instances`` list holds every graph
+        built during the test
+    """
+    FakeMediaPipeWrapper.instances = []
+    monkeypatch.setattr('pipedetect.detection.pose_detector.MediaPipeWrapper', FakeMediaPipeWrapper)
+    return FakeMediaPipeWrapper
@@ -1,12 +1,13 @@
 """Tests for core data models."""
 
+import numpy as np
 import pytest
 from datetime import datetime
 from pathlib import Path
 
 from pipedetect.core.models import (
     LandmarkPoint, PoseResult, DetectionConfig, 
-    ProcessingStats, OutputPaths
+    ProcessingStats, OutputPaths, landmarks_to_array, pose_confidence
 )
 
 
@@ -25,6 +26,26 @@ class TestLandmarkPoint:
         assert point.z == 0.1
         assert point.visibility == 0.9
         assert point.presence == 0.8
+    
+    def test_landmarks_to_array(self):
+        """Test packing landmarks into an array."""
+        landmarks = [
+            LandmarkPoint(x=0.5, y=0.3, z=0.1, visibility=0.9, presence=0.8),
+            LandmarkPoint(x=0.6, y=0.4, z=0.2, visibility=0.7, presence=1.0)
+        ]
+        
+        array = landmarks_to_array(landmarks)
+        
+        assert array.shape == (2, 5)
+        assert array[0].tolist() == [0.5, 0.3, 0.1, 0.9, 0.8]
+        assert array[1, 3] == 0.7
+        assert landmarks_to_array([]).shape == (0, 5)
+    
+    def test_pose_confidence(self):
+        """Test that pose confidence is the mean landmark visibility."""
+        points = np.random.default_rng(0).random((33, 5))
+        
+        assert pose_confidence(points) == float(points[:, 3].mean())
 
 
 class TestPoseResult:
@@ -50,31 +71,58 @@ class TestPoseResult:
         assert result.confidence == 0.95
         assert result.source_file == "test.jpg"
     
+    def test_landmarks_packed_as_array(self):
+        """Test that landmark points are stored as a single array."""
+        landmarks = [
+            LandmarkPoint(x=0.5, y=0.3, z=0.1, visibility=0.9, presence=0.8),
+            LandmarkPoint(x=0.6, y=0.4, z=0.2, visibility=0.7, presence=1.0)
+        ]
+        
+        from_points = PoseResult(
+            frame_id=1, timestamp=1.5, landmarks=landmarks,
+            confidence=0.8, source_file="test.jpg"
+        )
+        from_array = PoseResult(
+            frame_id=1, timestamp=1.5, landmarks=landmarks_to_array(landmarks),
+            confidence=0.8, source_file="test.jpg"
+        )
+        
+        assert isinstance(from_points.landmarks, np.ndarray)
+        assert from_points.landmarks.shape == (2, 5)
+        assert from_points.landmarks.tolist() == from_array.landmarks.tolist()
+    
+    @pytest.mark.parametrize("shape", [(10, 3), (33, 6), (5,), (2, 33, 5)])
+    def test_landmarks_wrong_shape(self, shape):
+        """Test that landmark arrays not shaped (N, 5) are rejected."""
+        with pytest.raises(ValueError, match="shape"):
+            PoseResult(
+                frame_id=1, timestamp=1.5, landmarks=np.zeros(shape),
+                confidence=0.5, source_file="test.jpg"
+            )
+    
     def test_confidence_validation(self):
         """Test confidence validation."""
         landmarks = [
             LandmarkPoint(x=0.5, y=0.3, z=0.1, visibility=0.9, presence=0.8)
         ]
         
-        # Valid confidence
         result = PoseResult(
             frame_id=1, timestamp=1.5, landmarks=landmarks,
             confidence=0.5, source_file="test.jpg"
         )
         assert result.confidence == 0.5
+    
+    @pytest.mark.parametrize("confidence", [1.5, -0.1])
+    def test_confidence_out_of_range(self, confidence):
+        """Test that confidences outside [0, 1] are rejected."""
+        landmarks = [
+            LandmarkPoint(x=0.5, y=0.3, z=0.1, visibility=0.9, presence=0.8)
+        ]
         
-        # Invalid confidence - too high
-        with pytest.raises(ValueError):
-            PoseResult(
-                frame_id=1, timestamp=1.5, landmarks=landmarks,
-                confidence=1.5, source_file="test.jpg"
-            )
-        
-        # Invalid confidence - too low
         with pytest.raises(ValueError):
             PoseResult(
                 frame_id=1, timestamp=1.5, landmarks=landmarks,
-                confidence=-0.1, source_file="test.jpg"
+                confidence=confidence, source_file="test.jpg"
             )
 
 
@@ -118,26 +166,19 @@ class TestDetectionConfig:
         assert config.min_detection_confidence == 0.0
         assert config.min_tracking_confidence == 1.0
         assert config.model_complexity == 0
-        
-        # Invalid confidence values
-        with pytest.raises(ValueError):
-            DetectionConfig(min_detection_confidence=-0.1)
-        
-        with pytest.raises(ValueError):
-            DetectionConfig(min_detection_confidence=1.1)
-        
-        with pytest.raises(ValueError):
-            DetectionConfig(min_tracking_confidence=-0.1)
-        
-        with pytest.raises(ValueError):
-            DetectionConfig(min_tracking_confidence=1.1)
-        
-        # Invalid model complexity
-        with pytest.raises(ValueError):
-            DetectionConfig(model_complexity=-1)
-        
+    
+    @pytest.mark.parametrize("field,value", [
+        ("min_detection_confidence", -0.1),
+        ("min_detection_confidence", 1.1),
+        ("min_tracking_confidence", -0.1),
+        ("min_tracking_confidence", 1.1),
+        ("model_complexity", -1),
+        ("model_complexity", 3),
+    ])
+    def test_config_out_of_range(self, field, value):
+        """Test that out-of-range configuration values are rejected."""
         with pytest.raises(ValueError):
-            DetectionConfig(model_complexity=3)
+            DetectionConfig(**{field: value})
 
 
 class TestProcessingStats:
@@ -3,8 +3,6 @@
 import pytest
 import json
 import csv
-import tempfile
-from pathlib import Path
 from datetime import datetime
 
 from pipedetect.io.exporters import JSONExporter, CSVExporter, ExporterFactory
@@ -50,120 +48,174 @@ def sample_stats():
 class TestJSONExporter:
     """Test JSON exporter functionality."""
     
-    def test_export_json(self, sample_pose_result, sample_stats):
+    def test_export_json(self, sample_pose_result, sample_stats, tmp_path):
         """Test JSON export functionality."""
         exporter = JSONExporter()
         results = [sample_pose_result]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "test_output.json"
-            
-            exporter.export(results, output_path, sample_stats)
-            
-            # Verify file was created
-            assert output_path.exists()
-            
-            # Verify content
-            with open(output_path, 'r') as f:
-                data = json.load(f)
-            
-            assert "metadata" in data
-            assert "results" in data
-            assert len(data["results"]) == 1
-            
-            # Check metadata
-            metadata = data["metadata"]
-            assert metadata["total_frames"] == 10
-            assert metadata["processed_frames"] == 8
-            assert metadata["success_rate"] == 0.8
-            
-            # Check result data
-            result = data["results"][0]
-            assert result["frame_id"] == 1
-            assert result["timestamp"] == 1.5
-            assert result["confidence"] == 0.95
-            assert result["source_file"] == "test.jpg"
-            assert len(result["landmarks"]) == 2
-            
-            # Check landmark data
-            landmark = result["landmarks"][0]
-            assert landmark["x"] == 0.5
-            assert landmark["y"] == 0.3
-            assert landmark["visibility"] == 0.9
+        output_path = tmp_path / "test_output.json"
+        
+        exporter.export(results, output_path, sample_stats)
+        
+        # Verify file was created
+        assert output_path.exists()
+        
+        # Verify content
+        with open(output_path, 'r') as f:
+            data = json.load(f)
+        
+        assert "metadata" in data
+        assert "results" in data
+        assert len(data["results"]) == 1
+        
+        # Check metadata
+        metadata = data["metadata"]
+        assert metadata["total_frames"] == 10
+        assert metadata["processed_frames"] == 8
+        assert metadata["success_rate"] == 0.8
+        
+        # Check result data
+        result = data["results"][0]
+        assert result["frame_id"] == 1
+        assert result["timestamp"] == 1.5
+        assert result["confidence"] == 0.95
+        assert result["source_file"] == "test.jpg"
+        assert len(result["landmarks"]) == 2
+        
+        # Check landmark data
+        landmark = result["landmarks"][0]
+        assert landmark["x"] == 0.5
+        assert landmark["y"] == 0.3
+        assert landmark["visibility"] == 0.9
     
-    def test_export_empty_results(self, sample_stats):
+    def test_export_empty_results(self, sample_stats, tmp_path):
         """Test exporting empty results."""
         exporter = JSONExporter()
         results = []
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "empty_output.json"
-            
-            exporter.export(results, output_path, sample_stats)
-            
-            # Verify file was created
-            assert output_path.exists()
-            
-            # Verify content
-            with open(output_path, 'r') as f:
-                data = json.load(f)
-            
-            assert len(data["results"]) == 0
+        output_path = tmp_path / "empty_output.json"
+        
+        exporter.export(results, output_path, sample_stats)
+        
+        # Verify file was created
+        assert output_path.exists()
+        
+        # Verify content
+        with open(output_path, 'r') as f:
+            data = json.load(f)
+        
+        assert len(data["results"]) == 0
+    
+    def test_stream_matches_json_dump(self, sample_pose_result, sample_stats, tmp_path):
+        """Test that streamed output is laid out like a single json.dump call."""
+        exporter = JSONExporter()
+        
+        output_path = tmp_path / "stream_output.json"
+        
+        with exporter.open_stream(output_path) as stream:
+            for frame_id in range(3):
+                stream.write(sample_pose_result.model_copy(update={"frame_id": frame_id}))
+            stream.finish(sample_stats)
+        
+        text = output_path.read_text(encoding='utf-8')
+        data = json.loads(text)
+        
+        assert text == json.dumps(data, indent=2, ensure_ascii=False)
+        assert list(data) == ["metadata", "results"]
+        assert [r["frame_id"] for r in data["results"]] == [0, 1, 2]
+        assert not list(tmp_path.glob("*.part"))
+    
+    def test_export_consumes_generator(self, sample_pose_result, sample_stats, tmp_path):
+        """Test that export accepts a lazily produced sequence of results."""
+        exporter = JSONExporter()
+        results = (
+            sample_pose_result.model_copy(update={"frame_id": frame_id}) for frame_id in range(4)
+        )
+        
+        output_path = tmp_path / "generator_output.json"
+        exporter.export(results, output_path, sample_stats)
+        
+        data = json.loads(output_path.read_text(encoding='utf-8'))
+        assert [r["frame_id"] for r in data["results"]] == [0, 1, 2, 3]
+    
+    def test_stream_discard(self, sample_pose_result, tmp_path):
+        """Test that discarding a stream leaves no files behind."""
+        exporter = JSONExporter()
+        
+        output_path = tmp_path / "discarded.json"
+        
+        with pytest.raises(RuntimeError):
+            with exporter.open_stream(output_path) as stream:
+                stream.write(sample_pose_result)
+                raise RuntimeError("interrupted")
+        
+        assert not any(tmp_path.iterdir())
 
 
 class TestCSVExporter:
     """Test CSV exporter functionality."""
     
-    def test_export_csv(self, sample_pose_result, sample_stats):
+    def test_export_csv(self, sample_pose_result, sample_stats, tmp_path):
         """Test CSV export functionality."""
         exporter = CSVExporter()
         results = [sample_pose_result]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "test_output.csv"
-            
-            exporter.export(results, output_path, sample_stats)
-            
-            # Verify file was created
-            assert output_path.exists()
-            
-            # Verify content
-            with open(output_path, 'r', newline='') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-            
-            # Should have header + 1 data row
-            assert len(rows) == 2
-            
-            # Check header
-            header = rows[0]
-            assert 'frame_id' in header
-            assert 'timestamp' in header
-            assert 'confidence' in header
-            assert 'source_file' in header
-            assert 'landmark_0_x' in header
-            assert 'landmark_0_y' in header
-            
-            # Check data row
-            data_row = rows[1]
-            assert data_row[0] == '1'  # frame_id
-            assert data_row[1] == '1.5'  # timestamp
-            assert data_row[2] == '0.95'  # confidence
-            assert data_row[3] == 'test.jpg'  # source_file
+        output_path = tmp_path / "test_output.csv"
+        
+        exporter.export(results, output_path, sample_stats)
+        
+        # Verify file was created
+        assert output_path.exists()
+        
+        # Verify content
+        with open(output_path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            rows = list(reader)
+        
+        # Should have header + 1 data row
+        assert len(rows) == 2
+        
+        # Check header
+        header = rows[0]
+        assert 'frame_id' in header
+        assert 'timestamp' in header
+        assert 'confidence' in header
+        assert 'source_file' in header
+        assert 'landmark_0_x' in header
+        assert 'landmark_0_y' in header
+        
+        # Check data row
+        data_row = rows[1]
+        assert data_row[0] == '1'  # frame_id
+        assert data_row[1] == '1.5'  # timestamp
+        assert data_row[2] == '0.95'  # confidence
+        assert data_row[3] == 'test.jpg'  # source_file
     
-    def test_export_empty_csv(self, sample_stats):
+    def test_export_empty_csv(self, sample_stats, tmp_path):
         """Test exporting empty CSV results."""
         exporter = CSVExporter()
         results = []
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "empty_output.csv"
-            
-            # Should not create file for empty results
-            exporter.export(results, output_path, sample_stats)
-            # The method returns early for empty results, so no file should be created
+        output_path = tmp_path / "empty_output.csv"
+        
+        # Should not create file for empty results
+        exporter.export(results, output_path, sample_stats)
+        # The method returns early for empty results, so no file should be created
+    
+    def test_stream_discard_csv(self, sample_pose_result, sample_stats, tmp_path):
+        """Test that discarding a CSV stream removes the partial file."""
+        exporter = CSVExporter()
+        
+        output_path = tmp_path / "discarded.csv"
+        
+        stream = exporter.open_stream(output_path)
+        stream.write(sample_pose_result)
+        assert output_path.exists()
+        
+        stream.discard()
+        assert not output_path.exists()
     
-    def test_csv_landmark_padding(self, sample_stats):
+    def test_csv_landmark_padding(self, sample_stats, tmp_path):
         """Test CSV export with fewer than 33 landmarks."""
         # Create result with only 1 landmark
         landmark = LandmarkPoint(x=0.5, y=0.3, z=0.1, visibility=0.9, presence=0.8)
@@ -175,29 +227,28 @@ class TestCSVExporter:
         exporter = CSVExporter()
         results = [pose_result]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "padded_output.csv"
-            
-            exporter.export(results, output_path, sample_stats)
-            
-            # Verify content
-            with open(output_path, 'r', newline='') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-            
-            # Check that we have the right number of columns
-            header = rows[0]
-            expected_columns = 4 + (33 * 5)  # 4 basic + 33 landmarks * 5 values each
-            assert len(header) == expected_columns
-            
-            # Check data row has right number of values
-            data_row = rows[1]
-            assert len(data_row) == expected_columns
-            
-            # First landmark should have real values
-            assert data_row[4] == '0.5'  # landmark_0_x
-            # Later landmarks should be padded with zeros
-            assert data_row[4 + 5] == '0.0'  # landmark_1_x (padded)
+        output_path = tmp_path / "padded_output.csv"
+        
+        exporter.export(results, output_path, sample_stats)
+        
+        # Verify content
+        with open(output_path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            rows = list(reader)
+        
+        # Check that we have the right number of columns
+        header = rows[0]
+        expected_columns = 4 + (33 * 5)  # 4 basic + 33 landmarks * 5 values each
+        assert len(header) == expected_columns
+        
+        # Check data row has right number of values
+        data_row = rows[1]
+        assert len(data_row) == expected_columns
+        
+        # First landmark should have real values
+        assert data_row[4] == '0.5'  # landmark_0_x
+        # Later landmarks should be padded with zeros
+        assert data_row[4 + 5] == '0.0'  # landmark_1_x (padded)
 
 
 class TestExporterFactory:
@@ -0,0 +1,34 @@
+"""Tests for output file management."""
+
+import shutil
+
+import numpy as np
+
+from pipedetect.io.file_manager import FileManager
+
+
+def _frame():
+    return np.zeros((8, 8, 3), dtype=np.uint8)
+
+
+class TestSaveFrames:
+    """Test saving frames and image copies."""
+    
+    def test_save_recreates_removed_directory(self, tmp_path):
+        """Test that saves recreate an output directory removed between calls."""
+        frames_dir = tmp_path / "frames"
+        overlay_dir = tmp_path / "overlay"
+        source = tmp_path / "source.jpg"
+        source.write_bytes(b"image")
+        
+        for attempt in (1, 2):
+            FileManager.save_frame(_frame(), frames_dir, attempt)
+            FileManager.save_overlay_frame(_frame(), overlay_dir, attempt)
+            FileManager.save_image_copy(source, frames_dir, 10 + attempt)
+            
+            assert (frames_dir / f"frame_{attempt:06d}.jpg").is_file()
+            assert (overlay_dir / f"overlay_{attempt:06d}.jpg").is_file()
+            assert (frames_dir / f"frame_{10 + attempt:06d}.jpg").is_file()
+            
+            shutil.rmtree(frames_dir)
+            shutil.rmtree(overlay_dir)
@@ -0,0 +1,50 @@
+"""Tests for scene-change detection."""
+
+import numpy as np
+
+from pipedetect.detection.frame_change import FrameChangeDetector
+
+
+def _frame(value, noise=0, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = np.full((120, 160, 3), value, dtype=np.int16)
+    frame += rng.integers(-noise, noise + 1, frame.shape, dtype=np.int16)
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+class TestFrameChangeDetector:
+    """Test FrameChangeDetector."""
+    
+    def test_first_frame_is_changed(self):
+        """Test that there is nothing to reuse before the first detection."""
+        assert not FrameChangeDetector(2.0).unchanged(_frame(100))
+    
+    def test_noise_is_unchanged(self):
+        """Test that sensor noise alone does not count as a change."""
+        detector = FrameChangeDetector(2.0)
+        detector.unchanged(_frame(100, noise=10, seed=0))
+        
+        assert detector.unchanged(_frame(100, noise=10, seed=1))
+    
+    def test_change_replaces_reference(self):
+        """Test that a real change is reported once and becomes the reference."""
+        detector = FrameChangeDetector(2.0)
+        detector.unchanged(_frame(100))
+        
+        assert not detector.unchanged(_frame(140))
+        assert detector.unchanged(_frame(140))
+    
+    def test_slow_drift_triggers_change(self):
+        """Test that small steps add up against the last detected frame."""
+        detector = FrameChangeDetector(2.0)
+        results = [detector.unchanged(_frame(100 + step)) for step in range(6)]
+        
+        assert results == [False, True, False, True, False, True]
+    
+    def test_reset(self):
+        """Test that resetting forgets the reference frame."""
+        detector = FrameChangeDetector(2.0)
+        detector.unchanged(_frame(100))
+        detector.reset()
+        
+        assert not detector.unchanged(_frame(100))
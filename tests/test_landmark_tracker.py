@@ -0,0 +1,59 @@
+"""Tests for optical-flow landmark tracking."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pipedetect.core.models import LandmarkPoint
+from pipedetect.detection.landmark_tracker import LandmarkTracker
+
+
+@pytest.fixture
+def textured_frame():
+    """Create a smooth random texture that optical flow can lock onto."""
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, 255, (240, 320), dtype=np.uint8)
+    blurred = cv2.GaussianBlur(noise, (0, 0), 3)
+    return cv2.cvtColor(cv2.equalizeHist(blurred), cv2.COLOR_GRAY2BGR)
+
+
+@pytest.fixture
+def landmarks():
+    """Create landmarks spread over the frame interior."""
+    return [
+        LandmarkPoint(x=0.3 + 0.1 * (i % 5), y=0.3 + 0.1 * (i // 5), z=0.1 * i,
+                      visibility=0.9, presence=1.0)
+        for i in range(15)
+    ]
+
+
+class TestLandmarkTracker:
+    """Test LandmarkTracker functionality."""
+    
+    def test_track_without_reference(self, textured_frame):
+        """Test that tracking needs a reference frame."""
+        assert LandmarkTracker().track(textured_frame) is None
+    
+    def test_track_follows_motion(self, textured_frame, landmarks):
+        """Test that landmarks follow a shifted frame."""
+        tracker = LandmarkTracker()
+        tracker.update(textured_frame, landmarks)
+        
+        shifted = np.roll(textured_frame, shift=(2, 4), axis=(0, 1))
+        tracked = tracker.track(shifted)
+        
+        assert tracked is not None
+        assert tracked.shape == (len(landmarks), 5)
+        for before, (x, y, z, visibility, _) in zip(landmarks, tracked.tolist()):
+            assert x == pytest.approx(before.x + 4 / 320, abs=1e-3)
+            assert y == pytest.approx(before.y + 2 / 240, abs=1e-3)
+            assert z == before.z
+            assert visibility == before.visibility
+    
+    def test_update_with_none_resets(self, textured_frame, landmarks):
+        """Test that losing the pose clears the reference."""
+        tracker = LandmarkTracker()
+        tracker.update(textured_frame, landmarks)
+        tracker.update(textured_frame, None)
+        
+        assert tracker.track(textured_frame) is None
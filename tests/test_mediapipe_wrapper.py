@@ -0,0 +1,110 @@
+"""Tests for the MediaPipe Tasks API backend of MediaPipeWrapper."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mediapipe.tasks.python.vision")
+
+from mediapipe.tasks.python import vision
+from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
+
+from pipedetect.core.models import DetectionConfig
+from pipedetect.detection.mediapipe_wrapper import MediaPipeWrapper
+
+
+class FakeLandmarker:
+    """Stand-in for PoseLandmarker that records the timestamps it is given."""
+    
+    def __init__(self, options):
+        self.options = options
+        self.timestamps = []
+        self.closed = False
+    
+    def detect_for_video(self, image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        if image.numpy_view().mean() < 128:
+            return SimpleNamespace(pose_landmarks=[])
+        landmark = NormalizedLandmark(x=0.5, y=0.25, z=0.0, visibility=0.9, presence=None)
+        return SimpleNamespace(pose_landmarks=[[landmark] * 33])
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeCPUOnlyLandmarker(FakeLandmarker):
+    """Stand-in for PoseLandmarker on a platform without a GPU delegate."""
+    
+    def __init__(self, options):
+        if options.base_options.delegate == options.base_options.Delegate.GPU:
+            raise RuntimeError("GPU delegate not supported")
+        super().__init__(options)
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """Create a placeholder model file."""
+    path = tmp_path / "pose.task"
+    path.write_bytes(b"model")
+    return path
+
+
+@pytest.fixture
+def wrapper(model_path):
+    """Create a wrapper using the Tasks API backend with a fake landmarker."""
+    config = DetectionConfig(model_asset_path=model_path)
+    with patch.object(vision.PoseLandmarker, 'create_from_options', FakeLandmarker):
+        pose_wrapper = MediaPipeWrapper(config)
+        yield pose_wrapper
+        pose_wrapper.close()
+
+
+def _frame(value):
+    return np.full((8, 8, 3), value, dtype=np.uint8)
+
+
+class TestTasksBackend:
+    """Test the PoseLandmarker backend."""
+    
+    def test_options(self, wrapper):
+        """Test that the landmarker runs in video mode on the GPU delegate."""
+        options = wrapper._landmarker.options
+        
+        assert options.running_mode == vision.RunningMode.VIDEO
+        assert options.base_options.model_asset_buffer == b"model"
+        assert options.base_options.delegate == options.base_options.Delegate.GPU
+        assert wrapper._delegate == "GPU"
+    
+    def test_gpu_fallback(self, model_path):
+        """Test that the CPU delegate is used when the GPU one cannot be created."""
+        config = DetectionConfig(model_asset_path=model_path)
+        with patch.object(vision.PoseLandmarker, 'create_from_options', FakeCPUOnlyLandmarker):
+            with MediaPipeWrapper(config) as pose_wrapper:
+                options = pose_wrapper._landmarker.options
+                assert options.base_options.delegate == options.base_options.Delegate.CPU
+                assert pose_wrapper._delegate == "CPU"
+    
+    def test_detect_pose(self, wrapper):
+        """Test that detected landmarks are packed into an array."""
+        landmarks = wrapper.detect_pose(_frame(255), timestamp_ms=0.0)
+        
+        assert landmarks.shape == (33, 5)
+        assert landmarks[0].tolist() == pytest.approx([0.5, 0.25, 0.0, 0.9, 1.0])
+        assert wrapper.detect_pose(_frame(0), timestamp_ms=40.0) is None
+    
+    def test_timestamps_strictly_increase(self, wrapper):
+        """Test that timestamps stay increasing across videos and plain images."""
+        for timestamp in (0.0, 40.0, 80.0, 0.0, 40.0):
+            wrapper.detect_pose(_frame(255), timestamp_ms=timestamp)
+        wrapper.detect_pose(_frame(255))
+        
+        assert wrapper._landmarker.timestamps == [0, 40, 80, 113, 153, 186]
+    
+    def test_close(self, wrapper):
+        """Test that closing the wrapper releases the landmarker."""
+        landmarker = wrapper._landmarker
+        wrapper.close()
+        
+        assert landmarker.closed
@@ -0,0 +1,91 @@
+"""Tests for pose overlay rendering."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pipedetect.core.models import LandmarkPoint, PoseResult
+from pipedetect.visualization.overlay_renderer import OverlayRenderer
+
+
+@pytest.fixture
+def pose_result():
+    """Create a pose result with all landmarks visible."""
+    landmarks = [
+        LandmarkPoint(x=0.2 + i * 0.02, y=0.3, z=0.0, visibility=0.9, presence=1.0)
+        for i in range(33)
+    ]
+    return PoseResult(
+        frame_id=1,
+        timestamp=0.5,
+        landmarks=landmarks,
+        confidence=0.9,
+        source_file="test.jpg"
+    )
+
+
+class TestOutputBuffer:
+    """Test rendering into caller-provided buffers."""
+    
+    def test_out_matches_copy(self, pose_result):
+        """Test that rendering into a buffer matches rendering into a copy."""
+        renderer = OverlayRenderer()
+        image = np.full((120, 160, 3), 40, dtype=np.uint8)
+        buffer = np.full_like(image, 255)
+        
+        expected = renderer.render_pose_with_confidence(image, pose_result)
+        rendered = renderer.render_pose_with_confidence(image, pose_result, out=buffer)
+        
+        assert rendered is buffer
+        np.testing.assert_array_equal(rendered, expected)
+        assert (image == 40).all()
+    
+    def test_in_place(self, pose_result):
+        """Test that passing the image as the buffer draws in place."""
+        renderer = OverlayRenderer()
+        image = np.full((120, 160, 3), 40, dtype=np.uint8)
+        expected = renderer.render_pose_with_confidence(image, pose_result)
+        
+        rendered = renderer.render_pose_with_confidence(image, pose_result, out=image)
+        
+        assert rendered is image
+        np.testing.assert_array_equal(image, expected)
+    
+    def test_nothing_to_draw(self, pose_result):
+        """Test that disabling both layers returns an unmodified copy."""
+        renderer = OverlayRenderer()
+        image = np.full((120, 160, 3), 40, dtype=np.uint8)
+        
+        rendered = renderer.render_pose_overlay(image, pose_result.landmarks,
+                                                draw_landmarks=False,
+                                                draw_connections=False)
+        
+        assert rendered is not image
+        np.testing.assert_array_equal(rendered, image)
+
+
+class TestPoseComparison:
+    """Test side-by-side comparison images."""
+    
+    def test_matching_heights(self):
+        """Test that equal-height images are placed side by side unchanged."""
+        original = np.full((60, 80, 3), 10, dtype=np.uint8)
+        overlay = np.full((60, 40, 3), 200, dtype=np.uint8)
+        
+        comparison = OverlayRenderer().create_pose_comparison(original, overlay)
+        
+        assert comparison.shape == (60, 120, 3)
+        assert (comparison[40:, :80] == 10).all()
+        assert (comparison[40:, 80:] == 200).all()
+    
+    def test_scales_to_shorter_height(self):
+        """Test that the taller image is resized to the shorter height."""
+        rng = np.random.default_rng(0)
+        original = rng.integers(0, 255, (120, 160, 3), dtype=np.uint8)
+        overlay = rng.integers(0, 255, (60, 100, 3), dtype=np.uint8)
+        
+        comparison = OverlayRenderer().create_pose_comparison(original, overlay)
+        
+        assert comparison.shape == (60, 180, 3)
+        np.testing.assert_array_equal(comparison[40:, :80], cv2.resize(original, (80, 60))[40:])
+        np.testing.assert_array_equal(comparison[40:, 80:], overlay[40:])
@@ -0,0 +1,72 @@
+"""Tests for the performance profiler."""
+
+import time
+from pipedetect.utils import performance
+from pipedetect.utils.performance import PerformanceProfiler
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestPerformanceProfiler:
+    """Test resource sampling and final metrics."""
+    
+    def test_samples_resources(self, monkeypatch):
+        """Test that CPU and memory are sampled while the profiler runs."""
+        monkeypatch.setattr(performance, '_SAMPLE_INTERVAL', 0.01)
+        with PerformanceProfiler() as profiler:
+            _busy(0.1)
+            profiler.update_frame_count(10)
+        
+        metrics = profiler.metrics
+        assert 0.0 < metrics.cpu_percent
+        assert 0.0 < metrics.memory_mb
+        assert 0.0 < metrics.memory_percent < 100.0
+        assert metrics.fps > 0.0
+    
+    def test_samples_on_frame_updates(self, monkeypatch):
+        """Test that frame updates sample resources only while monitoring runs."""
+        monkeypatch.setattr(performance, '_SAMPLE_INTERVAL', 0.01)
+        profiler = PerformanceProfiler()
+        profiler.start()
+        assert profiler.get_current_metrics()['cpu_percent'] == 0.0
+        
+        # The start sample has no CPU reading; a later frame update adds one
+        _busy(0.05)
+        profiler.increment_frame_count()
+        assert profiler.get_current_metrics()['cpu_percent'] > 0.0
+        
+        metrics = profiler.stop()
+        assert metrics.cpu_percent > 0.0
+        assert metrics.memory_mb > 0.0
+        
+        # Stopped profilers no longer sample
+        stopped = profiler.get_current_metrics()
+        _busy(0.05)
+        profiler.increment_frame_count()
+        profiler.update_frame_count(10)
+        current = profiler.get_current_metrics()
+        assert current['cpu_percent'] == stopped['cpu_percent']
+        assert current['memory_mb'] == stopped['memory_mb']
+    
+    def test_current_metrics(self, monkeypatch):
+        """Test that current metrics report the latest sample."""
+        monkeypatch.setattr(performance, '_SAMPLE_INTERVAL', 0.01)
+        with PerformanceProfiler() as profiler:
+            _busy(0.05)
+            current = profiler.get_current_metrics()
+        
+        assert current['memory_mb'] > 0.0
+        assert current['elapsed_time'] > 0.0
+    
+    def test_without_monitoring(self):
+        """Test that disabling monitoring leaves resource metrics at zero."""
+        with PerformanceProfiler(enable_monitoring=False) as profiler:
+            profiler.increment_frame_count()
+        
+        assert profiler.metrics.cpu_percent == 0.0
+        assert profiler.metrics.memory_mb == 0.0
+        assert profiler.metrics.frames_processed == 1
@@ -0,0 +1,220 @@
+"""Tests for the high-level pose detector."""
+
+import threading
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from pipedetect.core.models import DetectionConfig
+from pipedetect.core.exceptions import FileProcessingError
+from pipedetect.detection.pose_detector import DEFAULT_VIDEO_FPS, PoseDetector
+
+
+@pytest.fixture
+def detector(fake_mediapipe):
+    """Create a PoseDetector backed by the fake MediaPipe wrapper."""
+    pose_detector = PoseDetector(DetectionConfig(), num_workers=2)
+    yield pose_detector
+    pose_detector.close()
+
+
+def _frame(value):
+    return np.full((8, 8, 3), value, dtype=np.uint8)
+
+
+class TestDetectBatch:
+    """Test concurrent batch detection."""
+    
+    def test_results_keep_input_order(self, detector):
+        """Test that batch results line up with the input frames."""
+        values = [255, 0, 204, 51, 230]
+        results = detector.detect_batch([_frame(v) for v in values])
+        
+        assert len(results) == len(values)
+        for value, landmarks in zip(values, results):
+            if value < 128:
+                assert landmarks is None
+            else:
+                assert landmarks[0, 0] == pytest.approx(value / 255.0)
+    
+    def test_workers_use_own_graph(self, detector, fake_mediapipe):
+        """Test that batch workers never share the primary MediaPipe graph."""
+        detector.detect_batch([_frame(200)] * 16)
+        
+        primary = fake_mediapipe.instances[0]
+        workers = fake_mediapipe.instances[1:]
+        assert not primary.threads
+        assert 1 <= len(workers) <= 2
+        for wrapper in workers:
+            assert len(wrapper.threads) == 1
+    
+    def test_close_releases_workers(self, detector, fake_mediapipe):
+        """Test that closing the detector closes every worker graph."""
+        detector.detect_batch([_frame(200)] * 4)
+        detector.close()
+        
+        assert all(wrapper.closed for wrapper in fake_mediapipe.instances)
+    
+    def test_detect_image_batch(self, detector, tmp_path):
+        """Test batch detection from decoded images."""
+        images = [_frame(value) for value in (255, 0, 230)]
+        paths = [tmp_path / f"image_{i}.png" for i in range(len(images))]
+        
+        results = detector.detect_image_batch(images, paths, start_frame_id=10)
+        
+        assert results[1] is None
+        assert [r.frame_id for r in (results[0], results[2])] == [10, 12]
+        assert results[0].source_file == str(paths[0])
+        assert results[0].timestamp == 0.0
+        assert results[2].confidence == pytest.approx(230 / 255.0)
+
+
+class TestImageLoading:
+    """Test image decoding helpers."""
+    
+    def test_detect_single_image(self, detector, tmp_path):
+        """Test detection from an image file."""
+        path = tmp_path / "image.png"
+        cv2.imwrite(str(path), _frame(255))
+        
+        result = detector.detect_single_image(path, frame_id=3)
+        
+        assert result.frame_id == 3
+        assert result.source_file == str(path)
+    
+    def test_graph_reused_across_images(self, detector, fake_mediapipe, tmp_path):
+        """Test that per-image detection never rebuilds the MediaPipe graph."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"image_{i}.png"
+            cv2.imwrite(str(path), _frame(255))
+            paths.append(path)
+        
+        for frame_id, path in enumerate(paths):
+            detector.detect_single_image(path, frame_id=frame_id)
+        
+        assert len(fake_mediapipe.instances) == 1
+    
+    def test_context_manager_closes_graph(self, fake_mediapipe):
+        """Test that leaving the detector context releases the graph."""
+        with PoseDetector(DetectionConfig()) as pose_detector:
+            pose_detector.detect_image(_frame(255), "image.png")
+        
+        assert [wrapper.closed for wrapper in fake_mediapipe.instances] == [True]
+    
+    def test_detect_batch_images(self, detector, tmp_path):
+        """Test that directory detection picks up images in name order."""
+        for name in ("b.PNG", "a.jpg", "c.Jpeg", "notes.txt"):
+            cv2.imwrite(str(tmp_path / "tmp.png"), _frame(255))
+            (tmp_path / "tmp.png").rename(tmp_path / name)
+        (tmp_path / "nested.png").mkdir()
+        
+        results = list(detector.detect_batch_images(tmp_path))
+        
+        assert [Path(r.source_file).name for r in results] == ["a.jpg", "b.PNG", "c.Jpeg"]
+        assert [r.frame_id for r in results] == [0, 1, 2]
+    
+    def test_load_image_unreadable(self, tmp_path):
+        """Test that unreadable images raise FileProcessingError."""
+        bad_path = tmp_path / "broken.jpg"
+        bad_path.write_bytes(b"not an image")
+        
+        with pytest.raises(FileProcessingError, match="Cannot load image"):
+            PoseDetector.load_image(bad_path)
+
+
+class TestDetectVideo:
+    """Test video detection."""
+    
+    @staticmethod
+    def _write_video(path, values):
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (16, 16))
+        for value in values:
+            writer.write(np.full((16, 16, 3), value, dtype=np.uint8))
+        writer.release()
+    
+    def test_detect_video_frames_in_order(self, detector, tmp_path):
+        """Test that decoded frames are detected in order with real frame numbers."""
+        path = tmp_path / "clip.avi"
+        self._write_video(path, [255, 0, 230, 255, 0, 200])
+        
+        results = list(detector.detect_video(path))
+        
+        assert [result.frame_id for result, _ in results] == [0, 2, 3, 5]
+        assert results[1][0].timestamp == pytest.approx(0.2)
+        assert results[1][1].shape == (16, 16, 3)
+    
+    def test_detect_video_stride(self, detector, fake_mediapipe, tmp_path):
+        """Test that a stride processes every Nth frame with real frame numbers."""
+        path = tmp_path / "clip.avi"
+        self._write_video(path, [255, 255, 230, 255, 0, 200, 210])
+        
+        results = list(detector.detect_video(path, stride=2))
+        
+        assert [result.frame_id for result, _ in results] == [0, 2, 6]
+        assert fake_mediapipe.instances[0].calls == 4
+    
+    def test_detect_video_reuses_static_frames(self, fake_mediapipe, tmp_path):
+        """Test that unchanged frames reuse the previous detection."""
+        path = tmp_path / "clip.avi"
+        self._write_video(path, [255, 255, 255, 200, 200, 0])
+        config = DetectionConfig(static_frame_threshold=2.0)
+        
+        with PoseDetector(config) as pose_detector:
+            results = list(pose_detector.detect_video(path))
+        
+        assert [result.frame_id for result, _ in results] == [0, 1, 2, 3, 4]
+        assert fake_mediapipe.instances[0].calls == 3
+    
+    def test_detect_video_early_close(self, detector, tmp_path):
+        """Test that closing the generator early stops the decoder thread."""
+        path = tmp_path / "clip.avi"
+        self._write_video(path, [255] * 30)
+        
+        results = detector.detect_video(path)
+        next(results)
+        results.close()
+        
+        assert not [t for t in threading.enumerate() if t.name == "pipedetect-decoder"]
+    
+    def test_get_frame_from_video_reuses_capture(self, detector, tmp_path):
+        """Test random frame access through one cached capture."""
+        path = tmp_path / "clip.avi"
+        values = [0, 50, 100, 150, 200]
+        self._write_video(path, values)
+        
+        for frame_id in (3, 4, 1, 2):
+            frame = detector.get_frame_from_video(path, frame_id)
+            assert abs(float(frame.mean()) - values[frame_id]) < 3
+        
+        assert list(detector._capture_cache) == [str(path)]
+        reference = PoseDetector.open_video(path)
+        assert detector._capture_cache[str(path)].getBackendName() == reference.getBackendName()
+        reference.release()
+        assert detector.get_frame_from_video(path, 10) is None
+        assert detector.get_frame_from_video(tmp_path / "missing.avi", 0) is None
+        
+        detector.close()
+        assert not detector._capture_cache
+
+
+class TestVideoHelpers:
+    """Test video capture helpers."""
+    
+    class _Capture:
+        def __init__(self, fps):
+            self.fps = fps
+        
+        def get(self, prop):
+            assert prop == cv2.CAP_PROP_FPS
+            return self.fps
+    
+    def test_video_fps(self):
+        """Test that the reported frame rate is used."""
+        assert PoseDetector.get_video_fps(self._Capture(25.0)) == 25.0
+    
+    def test_video_fps_fallback(self):
+        """Test that videos without a frame rate fall back to the default."""
+        assert PoseDetector.get_video_fps(self._Capture(0.0)) == DEFAULT_VIDEO_FPS
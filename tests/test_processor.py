@@ -0,0 +1,229 @@
+"""Tests for the pose processing pipeline."""
+
+import csv
+import json
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from pipedetect.cli import processor as processor_module
+from pipedetect.cli.processor import PoseProcessor
+from pipedetect.core.exceptions import PipeDetectError
+from pipedetect.core.models import DetectionConfig
+from pipedetect.detection.landmark_tracker import LandmarkTracker
+from pipedetect.io.file_manager import FileManager
+
+
+def _write_video(path, frames, fps=10.0):
+    """Write frames to an MJPG video file."""
+    height, width = frames[0].shape[:2]
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+
+def _solid_frames(count):
+    """Create bright frames with a distinct gray level each."""
+    return [np.full((120, 160, 3), 130 + 3 * i, dtype=np.uint8) for i in range(count)]
+
+
+def _textured_frames(count):
+    """Create bright, smoothly textured frames drifting one pixel per frame."""
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, 255, (140, 200), dtype=np.uint8)
+    texture = cv2.GaussianBlur(noise, (0, 0), 3)
+    texture = cv2.normalize(texture, None, 150, 250, cv2.NORM_MINMAX)
+    return [
+        cv2.cvtColor(np.ascontiguousarray(texture[10:130, i:i + 160]), cv2.COLOR_GRAY2BGR)
+        for i in range(count)
+    ]
+
+
+class RecordingTracker(LandmarkTracker):
+    """LandmarkTracker that records the frames it failed to track."""
+    
+    failed = []
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._frame_index = 0
+    
+    def track(self, frame):
+        landmarks = super().track(frame)
+        if landmarks is None:
+            RecordingTracker.failed.append(self._frame_index)
+        return landmarks
+    
+    def update(self, frame, landmarks):
+        super().update(frame, landmarks)
+        self._frame_index += 1
+
+
+def _pipeline_threads():
+    return [t for t in threading.enumerate() if t.name in ("pipedetect-reader", "pipedetect-writer")]
+
+
+class TestPoseDetectorLifecycle:
+    """Test when the processor builds its in-process detector."""
+    
+    def test_detector_built_on_first_use(self, fake_mediapipe, tmp_path):
+        """Test that no MediaPipe graph is built until detection needs one."""
+        with PoseProcessor(DetectionConfig(), tmp_path, show_progress=False, workers=2) as processor:
+            assert fake_mediapipe.instances == []
+            
+            detector = processor.pose_detector
+            assert processor.pose_detector is detector
+        
+        assert [wrapper.closed for wrapper in fake_mediapipe.instances] == [True]
+    
+    def test_close_without_detector(self, fake_mediapipe, tmp_path):
+        """Test that closing an unused processor builds no detector."""
+        PoseProcessor(DetectionConfig(), tmp_path, show_progress=False).close()
+        
+        assert fake_mediapipe.instances == []
+
+
+class TestVideoPipeline:
+    """Test the decode, detect and write pipeline for videos."""
+    
+    def test_results_and_frames_in_order(self, fake_mediapipe, tmp_path):
+        """Test that every frame yields an ordered result and saved images."""
+        video_path = tmp_path / "clip.avi"
+        _write_video(video_path, _solid_frames(25))
+        output_dir = tmp_path / "out"
+        
+        with PoseProcessor(DetectionConfig(), output_dir, show_progress=False, prefetch=2) as processor:
+            stats = processor.process_input(video_path, "poses.json", "poses.csv")
+        
+        assert stats.processed_frames == stats.total_frames == 25
+        
+        data = json.loads((output_dir / "poses.json").read_text())
+        assert [r["frame_id"] for r in data["results"]] == list(range(25))
+        
+        with open(output_dir / "poses.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [int(row["frame_id"]) for row in rows] == list(range(25))
+        
+        frames = sorted(p.name for p in output_dir.glob("frames_*/*.jpg"))
+        overlays = sorted(p.name for p in output_dir.glob("overlay_*/*.jpg"))
+        assert frames == [f"frame_{i:06d}.jpg" for i in range(25)]
+        assert overlays == [f"overlay_{i:06d}.jpg" for i in range(25)]
+        assert not _pipeline_threads()
+    
+    def test_overlays_match_their_frames(self, fake_mediapipe, tmp_path):
+        """Test that recycled overlay buffers never leak another frame's pixels."""
+        io_workers = 1
+        count = 4 * io_workers + 9
+        video_path = tmp_path / "clip.avi"
+        _write_video(video_path, _solid_frames(count))
+        output_dir = tmp_path / "out"
+        
+        with PoseProcessor(DetectionConfig(), output_dir, show_progress=False,
+                           prefetch=2, io_workers=io_workers) as processor:
+            processor.process_input(video_path)
+        
+        frames = sorted(output_dir.glob("frames_*/*.jpg"))
+        overlays = sorted(output_dir.glob("overlay_*/*.jpg"))
+        assert len(frames) == len(overlays) == count
+        
+        # Compare a corner away from the drawn landmarks and text
+        for frame_path, overlay_path in zip(frames, overlays):
+            frame_level = cv2.imread(str(frame_path))[100:, 140:].mean()
+            overlay_level = cv2.imread(str(overlay_path))[100:, 140:].mean()
+            assert abs(overlay_level - frame_level) < 1.5
+    
+    def test_skip_frames_detects_on_stride(self, fake_mediapipe, tmp_path, monkeypatch):
+        """Test that skipped frames are tracked and detection runs on the stride."""
+        RecordingTracker.failed = []
+        monkeypatch.setattr(processor_module, "LandmarkTracker", RecordingTracker)
+        video_path = tmp_path / "clip.avi"
+        frames = _textured_frames(20)
+        
+        # Optical flow finds nothing to follow out of a flat frame
+        frames[7] = np.full_like(frames[7], 200)
+        _write_video(video_path, frames)
+        output_dir = tmp_path / "out"
+        
+        with PoseProcessor(DetectionConfig(), output_dir, save_frames=False, save_overlays=False,
+                           show_progress=False, skip_frames=3) as processor:
+            stats = processor.process_input(video_path, "poses.json")
+        
+        assert stats.processed_frames == stats.total_frames == 20
+        data = json.loads((output_dir / "poses.json").read_text())
+        assert [r["frame_id"] for r in data["results"]] == list(range(20))
+        
+        # Detection runs on stride frames and on frames whose track failed
+        detected = [round(t * 10.0 / 1000.0) for t in fake_mediapipe.instances[0].timestamps]
+        expected = sorted(set(range(0, 20, 3)) | set(RecordingTracker.failed))
+        assert detected == expected
+        assert 8 in RecordingTracker.failed
+        assert len(detected) < 20
+    
+    def test_writer_error_reaches_caller(self, fake_mediapipe, tmp_path):
+        """Test that a failure in the writer thread is raised from process_input."""
+        video_path = tmp_path / "clip.avi"
+        _write_video(video_path, _solid_frames(25))
+        
+        with PoseProcessor(DetectionConfig(), tmp_path / "out", show_progress=False, prefetch=2) as processor:
+            render = processor.overlay_renderer.render_pose_with_confidence
+            
+            def failing_render(image, result, **kwargs):
+                if result.frame_id == 5:
+                    raise RuntimeError("overlay failed")
+                return render(image, result, **kwargs)
+            
+            processor.overlay_renderer.render_pose_with_confidence = failing_render
+            with pytest.raises(PipeDetectError, match="overlay failed"):
+                processor.process_input(video_path)
+        
+        assert not _pipeline_threads()
+    
+    def test_early_close_stops_threads(self, fake_mediapipe, tmp_path):
+        """Test that closing the results generator early joins both stages."""
+        video_path = tmp_path / "clip.avi"
+        _write_video(video_path, _solid_frames(40))
+        output_paths = FileManager.create_output_paths(tmp_path / "out", video_path.name)
+        
+        with PoseProcessor(DetectionConfig(), tmp_path / "out", show_progress=False, prefetch=2) as processor:
+            results = processor._process_video(video_path, output_paths)
+            assert next(results).frame_id == 0
+            
+            closer = threading.Thread(target=results.close)
+            closer.start()
+            closer.join(timeout=10)
+            
+            assert not closer.is_alive()
+            assert not _pipeline_threads()
+
+
+class TestImagePipeline:
+    """Test processing of single images and image directories."""
+    
+    @pytest.mark.parametrize("directory", [False, True])
+    def test_frame_copies_run_on_io_pool(self, fake_mediapipe, tmp_path, monkeypatch, directory):
+        """Test that saved image copies are written by the I/O pool."""
+        image_dir = tmp_path / "images"
+        image_dir.mkdir()
+        for i in range(3):
+            cv2.imwrite(str(image_dir / f"image_{i}.png"), np.full((32, 32, 3), 200, dtype=np.uint8))
+        input_path = image_dir if directory else image_dir / "image_0.png"
+        
+        copy_threads = []
+        save_image_copy = FileManager.save_image_copy
+        
+        def recording_copy(*args):
+            copy_threads.append(threading.current_thread().name)
+            save_image_copy(*args)
+        
+        monkeypatch.setattr(FileManager, "save_image_copy", recording_copy)
+        output_dir = tmp_path / "out"
+        with PoseProcessor(DetectionConfig(), output_dir, show_progress=False) as processor:
+            processor.process_input(input_path)
+        
+        expected = 3 if directory else 1
+        assert len(copy_threads) == expected
+        assert all(name.startswith("pipedetect-io") for name in copy_threads)
+        assert len(list(output_dir.glob("frames_*/frame_*.png"))) == expected
@@ -0,0 +1,44 @@
+"""Tests for the progress tracker."""
+
+import io
+
+from rich.console import Console
+
+from pipedetect.visualization.progress_tracker import ProgressTracker
+
+
+def _tracker():
+    return ProgressTracker(Console(file=io.StringIO()))
+
+
+class TestProgressTracker:
+    """Test progress updates."""
+    
+    def test_update_advances_task(self):
+        """Test that updates advance the task and can change its description."""
+        tracker = _tracker()
+        tracker.start(10, "Processing")
+        tracker.update()
+        tracker.update(2, description="Halfway")
+        
+        progress = tracker.get_current_progress()
+        assert progress['completed'] == 3
+        assert progress['total'] == 10
+        assert tracker._task.description == "Halfway"
+        
+        tracker.finish()
+        assert not tracker.is_active()
+        assert tracker.get_current_progress() == {}
+    
+    def test_restart_tracks_new_task(self):
+        """Test that a restarted tracker reports its new task."""
+        tracker = _tracker()
+        tracker.start(10)
+        tracker.update(4)
+        tracker.finish()
+        
+        tracker.start(5)
+        tracker.update()
+        
+        assert tracker.get_current_progress()['completed'] == 1
+        tracker.finish()
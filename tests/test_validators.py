@@ -1,125 +1,170 @@
 """Tests for input validators."""
 
+import os
+import shutil
+
 import pytest
-import tempfile
-from pathlib import Path
 
-from pipedetect.io.validators import InputValidator
+from pipedetect.io.validators import InputValidator, _has_image_ext, _has_video_ext
 from pipedetect.core.exceptions import ValidationError
 
 
+@pytest.fixture(scope="module")
+def media_dir(tmp_path_factory):
+    """Create one directory of empty media files shared by read-only tests."""
+    directory = tmp_path_factory.mktemp("media")
+    for name in ("test.jpg", "test.jpeg", "test.png", "test.bmp", "test.tiff", "test.webp",
+                 "test.JPG", "test.PNG", "test.mp4", "test.avi", "test.mov", "test.mkv",
+                 "test.wmv", "test.webm", "test.MP4", "test.AVI", "test.txt"):
+        (directory / name).touch()
+    return directory
+
+
 class TestInputValidator:
     """Test InputValidator functionality."""
     
-    def test_validate_confidence_threshold(self):
+    @pytest.mark.parametrize("confidence", [0.0, 0.5, 1.0])
+    def test_validate_confidence_threshold(self, confidence):
         """Test confidence threshold validation."""
-        # Valid values
-        assert InputValidator.validate_confidence_threshold(0.0) == 0.0
-        assert InputValidator.validate_confidence_threshold(0.5) == 0.5
-        assert InputValidator.validate_confidence_threshold(1.0) == 1.0
-        
-        # Invalid values
-        with pytest.raises(ValidationError):
-            InputValidator.validate_confidence_threshold(-0.1)
-        
+        assert InputValidator.validate_confidence_threshold(confidence) == confidence
+    
+    @pytest.mark.parametrize("confidence", [-0.1, 1.1, float('nan'), float('inf')])
+    def test_validate_confidence_threshold_invalid(self, confidence):
+        """Test that thresholds outside [0, 1], including NaN, are rejected."""
         with pytest.raises(ValidationError):
-            InputValidator.validate_confidence_threshold(1.1)
+            InputValidator.validate_confidence_threshold(confidence)
     
-    def test_validate_input_path_nonexistent(self):
+    def test_validate_input_path_nonexistent(self, tmp_path):
         """Test validation of non-existent paths."""
         with pytest.raises(ValidationError, match="does not exist"):
-            InputValidator.validate_input_path("/nonexistent/path")
+            InputValidator.validate_input_path(str(tmp_path / "does_not_exist"))
     
-    def test_is_image_file(self):
+    @pytest.mark.parametrize("name,expected", [
+        ("test.jpg", True), ("test.jpeg", True), ("test.png", True),
+        ("test.bmp", True), ("test.tiff", True), ("test.webp", True),
+        # Case insensitivity
+        ("test.JPG", True), ("test.PNG", True),
+        # Unsupported extensions
+        ("test.txt", False), ("test.mp4", False),
+    ])
+    def test_is_image_file(self, media_dir, name, expected):
         """Test image file detection."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create actual files for testing
-            image_files = ["test.jpg", "test.jpeg", "test.png", "test.bmp", "test.tiff", "test.webp"]
-            for filename in image_files:
-                (temp_path / filename).touch()
-                assert InputValidator.is_image_file(temp_path / filename)
-            
-            # Test case insensitivity
-            (temp_path / "test.JPG").touch()
-            (temp_path / "test.PNG").touch()
-            assert InputValidator.is_image_file(temp_path / "test.JPG")
-            assert InputValidator.is_image_file(temp_path / "test.PNG")
-            
-            # Test unsupported extensions
-            (temp_path / "test.txt").touch()
-            (temp_path / "test.mp4").touch()
-            assert not InputValidator.is_image_file(temp_path / "test.txt")
-            assert not InputValidator.is_image_file(temp_path / "test.mp4")
+        assert InputValidator.is_image_file(media_dir / name) is expected
     
-    def test_is_video_file(self):
+    @pytest.mark.parametrize("name,expected", [
+        ("test.mp4", True), ("test.avi", True), ("test.mov", True),
+        ("test.mkv", True), ("test.wmv", True), ("test.webm", True),
+        # Case insensitivity
+        ("test.MP4", True), ("test.AVI", True),
+        # Unsupported extensions
+        ("test.txt", False), ("test.jpg", False),
+    ])
+    def test_is_video_file(self, media_dir, name, expected):
         """Test video file detection."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create actual files for testing
-            video_files = ["test.mp4", "test.avi", "test.mov", "test.mkv", "test.wmv", "test.webm"]
-            for filename in video_files:
-                (temp_path / filename).touch()
-                assert InputValidator.is_video_file(temp_path / filename)
-            
-            # Test case insensitivity
-            (temp_path / "test.MP4").touch()
-            (temp_path / "test.AVI").touch()
-            assert InputValidator.is_video_file(temp_path / "test.MP4")
-            assert InputValidator.is_video_file(temp_path / "test.AVI")
-            
-            # Test unsupported extensions
-            (temp_path / "test.txt").touch()
-            (temp_path / "test.jpg").touch()
-            assert not InputValidator.is_video_file(temp_path / "test.txt")
-            assert not InputValidator.is_video_file(temp_path / "test.jpg")
+        assert InputValidator.is_video_file(media_dir / name) is expected
     
-    def test_get_input_type_with_temp_files(self):
+    def test_file_checks_stat_only_matching_names(self, media_dir, monkeypatch):
+        """Test that file checks reject other extensions before touching the filesystem."""
+        calls = []
+        real_stat = os.stat
+        
+        def counting_stat(*args, **kwargs):
+            calls.append(args[0])
+            return real_stat(*args, **kwargs)
+        
+        monkeypatch.setattr(os, "stat", counting_stat)
+        assert not InputValidator.is_image_file(media_dir / "test.mp4")
+        assert not InputValidator.is_video_file(media_dir / "test.jpg")
+        assert calls == []
+        
+        assert InputValidator.is_image_file(media_dir / "test.jpg")
+        assert InputValidator.is_video_file(media_dir / "test.mp4")
+        assert len(calls) == 2
+    
+    def test_get_input_type_with_temp_files(self, tmp_path):
         """Test input type detection with temporary files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Test directory
-            assert InputValidator.get_input_type(temp_path) == "directory"
-            
-            # Test image file
-            image_file = temp_path / "test.jpg"
-            image_file.touch()
-            assert InputValidator.get_input_type(image_file) == "image"
-            
-            # Test video file
-            video_file = temp_path / "test.mp4"
-            video_file.touch()
-            assert InputValidator.get_input_type(video_file) == "video"
-            
-            # Test unsupported file
-            text_file = temp_path / "test.txt"
-            text_file.touch()
-            with pytest.raises(ValidationError, match="Unsupported file format"):
-                InputValidator.get_input_type(text_file)
+        for name in ("test.jpg", "test.mp4", "test.txt"):
+            (tmp_path / name).touch()
+        
+        assert InputValidator.get_input_type(tmp_path / "test.jpg") == "image"
+        assert InputValidator.get_input_type(tmp_path / "test.mp4") == "video"
+        
+        # Test unsupported file
+        with pytest.raises(ValidationError, match="Unsupported file format"):
+            InputValidator.get_input_type(tmp_path / "test.txt")
+        
+        # Test directory, with contents as in real use
+        assert InputValidator.get_input_type(tmp_path) == "directory"
     
-    def test_validate_image_directory(self):
+    def test_get_input_type_uses_single_stat(self, tmp_path, monkeypatch):
+        """Test that input type detection stats the path at most once."""
+        (tmp_path / "x.jpg").touch()
+        (tmp_path / "x.mp4").touch()
+        calls = []
+        real_stat = os.stat
+        
+        def counting_stat(*args, **kwargs):
+            calls.append(args[0])
+            return real_stat(*args, **kwargs)
+        
+        monkeypatch.setattr(os, "stat", counting_stat)
+        for path in (tmp_path / "x.jpg", tmp_path / "x.mp4", tmp_path):
+            calls.clear()
+            InputValidator.get_input_type(path)
+            assert len(calls) <= 1
+    
+    def test_validate_image_directory(self, tmp_path):
         """Test image directory validation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Empty directory
-            with pytest.raises(ValidationError, match="No supported image files"):
-                InputValidator.validate_image_directory(temp_path)
-            
-            # Directory with images
-            (temp_path / "image1.jpg").touch()
-            (temp_path / "image2.png").touch()
-            (temp_path / "text.txt").touch()  # Should be ignored
-            
-            image_files = InputValidator.validate_image_directory(temp_path)
-            assert len(image_files) == 2
-            assert all(f.suffix.lower() in {'.jpg', '.png'} for f in image_files)
-            
-            # Test with non-directory
-            file_path = temp_path / "not_a_dir.txt"
-            file_path.touch()
-            with pytest.raises(ValidationError, match="Not a directory"):
-                InputValidator.validate_image_directory(file_path) 
\ No newline at end of file
+        # Empty directory
+        with pytest.raises(ValidationError, match="No supported image files"):
+            InputValidator.validate_image_directory(tmp_path)
+        
+        # Directory with images
+        (tmp_path / "image1.jpg").touch()
+        (tmp_path / "image2.png").touch()
+        (tmp_path / "text.txt").touch()  # Should be ignored
+        
+        image_files = InputValidator.validate_image_directory(tmp_path)
+        assert {f.name for f in image_files} == {"image1.jpg", "image2.png"}
+        
+        # Test with non-directory
+        file_path = tmp_path / "not_a_dir.txt"
+        file_path.touch()
+        with pytest.raises(ValidationError, match="Not a directory"):
+            InputValidator.validate_image_directory(file_path) 
+    
+    def test_validate_image_directory_entries(self, tmp_path):
+        """Test that only image files are listed, sorted, whatever their case."""
+        (tmp_path / "b.PNG").touch()
+        (tmp_path / "a.jpeg").touch()
+        (tmp_path / "album.jpg").mkdir()  # Directories are never images
+        
+        image_files = InputValidator.validate_image_directory(tmp_path)
+        assert [f.name for f in image_files] == ["a.jpeg", "b.PNG"]
+    
+    def test_validate_output_path(self, tmp_path):
+        """Test that missing parent directories are created."""
+        output_path = tmp_path / "nested" / "out" / "results.json"
+        
+        path = InputValidator.validate_output_path(str(output_path))
+        assert path == output_path
+        assert output_path.parent.is_dir()
+        
+        # Repeat calls for the same directory are fine
+        assert InputValidator.validate_output_path(output_path) == output_path
+        
+        # A parent removed since the last call is created again
+        shutil.rmtree(tmp_path / "nested")
+        InputValidator.validate_output_path(output_path)
+        assert output_path.parent.is_dir()
+    
+    @pytest.mark.parametrize("name", [
+        "a.jpg", "a.JPEG", "a.tif", "a.tiff", "a.tifff", "a..png", "a.b.webp",
+        ".jpg", "..jpg", "...", "a.", "a.jpg.bak", "a.jpg\n", "clip.MP4", "clip.m4v",
+    ])
+    def test_extension_matching(self, name):
+        """Test that extension matching agrees with splitext-based lookup."""
+        extension = os.path.splitext(name)[1].lower()
+        
+        assert _has_image_ext(name) is (extension in InputValidator.SUPPORTED_IMAGE_EXTENSIONS)
+        assert _has_video_ext(name) is (extension in InputValidator.SUPPORTED_VIDEO_EXTENSIONS)